@@ -9,8 +9,11 @@ import time
 import random
 import math
 
+import numpy as np
+
 from gps_modulator import VelocityAnomalyDetector, PathCorrector
 from gps_modulator.streaming import EnhancedGpsReader, IMUStreamer
+from gps_modulator.utils import haversine_distance_batch
 from gps_modulator.visualization import LivePathPlotter
 
 
@@ -86,6 +89,15 @@ def simulate_imu_data_for_gps(gps_point, prev_point=None):
     }
 
 
+def nan_join(parts):
+    """Join coordinate runs with NaN gaps so one Line2D draws all of them."""
+    gap = np.array([np.nan])
+    joined = []
+    for part in parts:
+        joined.extend((part, gap))
+    return np.concatenate(joined[:-1]) if joined else np.empty(0)
+
+
 def run_imu_integration_demo():
     """Create a compelling visual story of GPS spoofing and IMU rescue."""
     print(" Creating GPS Spoofing Detection Story...")
@@ -102,11 +114,13 @@ def run_imu_integration_demo():
     # Create story-driven GPS path
     gps_path, spoof_segments = create_mock_gps_path()
     
-    # Process data with storytelling focus
-    raw_lats = [p['latitude'] for p in gps_path]
-    raw_lons = [p['longitude'] for p in gps_path]
-    corrected_lats = []
-    corrected_lons = []
+    # Process data with storytelling focus; coordinates are extracted once
+    # into arrays so the plotting below works on slices and masks
+    n_points = len(gps_path)
+    raw_lats = np.fromiter((p['latitude'] for p in gps_path), np.float64, n_points)
+    raw_lons = np.fromiter((p['longitude'] for p in gps_path), np.float64, n_points)
+    corrected_lats = np.empty(n_points)
+    corrected_lons = np.empty(n_points)
     
     # Track spoofing events and IMU corrections
     spoof_events = []
@@ -151,8 +165,8 @@ def run_imu_integration_demo():
             else:
                 corrected_point = corrector.correct(gps_point, is_spoofed=False)
             
-            corrected_lats.append(corrected_point['latitude'])
-            corrected_lons.append(corrected_point['longitude'])
+            corrected_lats[i] = corrected_point['latitude']
+            corrected_lons[i] = corrected_point['longitude']
             prev_corrected_point = corrected_point
         
         # Create IMU-assisted spoofing mitigation visualization
@@ -161,59 +175,46 @@ def run_imu_integration_demo():
                     fontsize=16, fontweight='bold')
         
         # Plot clean GPS segments (non-spoofed parts only)
-        clean_segments = []
-        current_segment = []
+        in_spoof_zone = np.zeros(n_points, dtype=bool)
+        for start, end, _ in spoof_segments:
+            in_spoof_zone[start:end + 1] = True
         
-        for i in range(len(raw_lons)):
-            is_in_spoof_zone = any(start <= i <= end for start, end, _ in spoof_segments)
-            
-            if not is_in_spoof_zone:
-                current_segment.append(i)
-            else:
-                if current_segment:
-                    clean_segments.append(current_segment)
-                    current_segment = []
+        # Runs of clean points as [start, stop) index pairs
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], ~in_spoof_zone, [False]))))
+        clean_segments = edges.reshape(-1, 2)
         
-        if current_segment:
-            clean_segments.append(current_segment)
+        # Plot only the clean GPS segments in blue, as a single line
+        clean_segments = [(a, b) for a, b in clean_segments if b - a > 1]
+        ax.plot(nan_join([raw_lons[a:b] for a, b in clean_segments]),
+               nan_join([raw_lats[a:b] for a, b in clean_segments]),
+               'b-', linewidth=2.5, alpha=0.8, label='Raw GPS Trajectory', zorder=1)
         
-        # Plot only the clean GPS segments in blue
-        for seg_idx, segment in enumerate(clean_segments):
-            if len(segment) > 1:
-                seg_lats = [raw_lats[i] for i in segment]
-                seg_lons = [raw_lons[i] for i in segment]
-                ax.plot(seg_lons, seg_lats, 'b-', linewidth=2.5, alpha=0.8, 
-                       label='Raw GPS Trajectory' if seg_idx == 0 else "", zorder=1)
+        # Plot IMU corrections ONLY within spoofing segments; the runs of
+        # every attack are collected and drawn as one line per category
+        spoofed_runs = []
+        imu_runs = []
         
-        # Plot IMU corrections ONLY within spoofing segments
-        imu_plotted = False
-        
-        for seg_idx, (start, end, _) in enumerate(spoof_segments):
+        for start, end, _ in spoof_segments:
             if start < len(corrected_lons) and end < len(corrected_lons):
                 # Grey out the spoofed GPS segment first
                 spoofed_lats = raw_lats[start:end+1]
                 spoofed_lons = raw_lons[start:end+1]
-                ax.plot(spoofed_lons, spoofed_lats, 'r-', 
-                       linewidth=2.5, alpha=0.3, 
-                       label='Spoofed GPS Segment' if seg_idx == 0 else "", zorder=2)
+                spoofed_runs.append((spoofed_lons, spoofed_lats))
                 
-                # Add red shaded anomaly zone
-                if spoofed_lons and spoofed_lats:
-                    x_min = min(spoofed_lons) - 0.0001
-                    x_max = max(spoofed_lons) + 0.0001
-                    y_min = min(spoofed_lats) - 0.0001
-                    y_max = max(spoofed_lats) + 0.0001
-                    
-                    rect = Rectangle((x_min, y_min), (x_max - x_min), (y_max - y_min),
-                                   facecolor='#ffcccc', alpha=0.4, edgecolor='red', 
-                                   linewidth=1, zorder=0)
-                    ax.add_patch(rect)
+                # Add red shaded anomaly zone (the bounds check above
+                # guarantees a non-empty segment)
+                x_min = spoofed_lons.min() - 0.0001
+                x_max = spoofed_lons.max() + 0.0001
+                y_min = spoofed_lats.min() - 0.0001
+                y_max = spoofed_lats.max() + 0.0001
                 
-                # Create IMU correction path ONLY within this spoofed zone
-                imu_lats = []
-                imu_lons = []
+                rect = Rectangle((x_min, y_min), (x_max - x_min), (y_max - y_min),
+                               facecolor='#ffcccc', alpha=0.4, edgecolor='red', 
+                               linewidth=1, zorder=0)
+                ax.add_patch(rect)
                 
-                # Start from last clean GPS position
+                # Create IMU correction path ONLY within this spoofed zone,
+                # starting from last clean GPS position
                 if start > 0:
                     start_lat = raw_lats[start-1]
                     start_lon = raw_lons[start-1]
@@ -221,19 +222,23 @@ def run_imu_integration_demo():
                     start_lat = raw_lats[0]
                     start_lon = raw_lons[0]
                 
-                # Create smooth IMU path through the spoofed zone
-                for i in range(end - start + 1):
-                    # Use normal progression (what IMU would calculate)
-                    imu_lat = start_lat + ((i + 1) * 0.0001)
-                    imu_lon = start_lon + ((i + 1) * 0.0001)
-                    imu_lats.append(imu_lat)
-                    imu_lons.append(imu_lon)
+                # Create smooth IMU path through the spoofed zone using
+                # normal progression (what IMU would calculate)
+                steps = np.arange(1, end - start + 2) * 0.0001
+                imu_lats = start_lat + steps
+                imu_lons = start_lon + steps
                 
-                # Plot IMU correction path only in this zone
-                ax.plot(imu_lons, imu_lats, 'green', linewidth=3.0, 
-                       label='IMU-Based Correction' if not imu_plotted else "", 
-                       zorder=3, alpha=0.9)
-                imu_plotted = True
+                imu_runs.append((imu_lons, imu_lats))
+        
+        if spoofed_runs:
+            lons, lats = zip(*spoofed_runs)
+            ax.plot(nan_join(lons), nan_join(lats), 'r-', 
+                   linewidth=2.5, alpha=0.3, label='Spoofed GPS Segment', zorder=2)
+            
+            # Plot IMU correction paths only in the spoofed zones
+            lons, lats = zip(*imu_runs)
+            ax.plot(nan_join(lons), nan_join(lats), 'green', linewidth=3.0, 
+                   label='IMU-Based Correction', zorder=3, alpha=0.9)
         
         # Add specific annotations for IMU dead reckoning
         for idx, (start, end, _) in enumerate(spoof_segments):
@@ -316,8 +321,11 @@ def compare_correction_methods():
     
     detector = VelocityAnomalyDetector()
     
-    gps_only_errors = []
-    imu_errors = []
+    # (latitude, longitude) per detected spoofing event; errors are computed
+    # for all events at once after the loop
+    expected_positions = []
+    gps_only_positions = []
+    imu_positions = []
     
     prev_point = None
     
@@ -334,28 +342,27 @@ def compare_correction_methods():
             expected_lat = gps_path[i-1]['latitude'] + 0.0001
             expected_lon = gps_path[i-1]['longitude'] + 0.0001
             
+            expected_positions.append((expected_lat, expected_lon))
+            
             # GPS-only correction
             gps_corrected = corrector_gps.correct(gps_point, is_spoofed=True)
-            gps_error = math.sqrt(
-                (gps_corrected['latitude'] - expected_lat)**2 +
-                (gps_corrected['longitude'] - expected_lon)**2
-            ) * 111000  # Convert to meters
-            gps_only_errors.append(gps_error)
+            gps_only_positions.append((gps_corrected['latitude'], gps_corrected['longitude']))
             
             # IMU-enhanced correction
             imu_data = simulate_imu_data_for_gps(gps_point, prev_point)
             imu_corrected = corrector_imu.correct(gps_point, is_spoofed=True, imu_data=imu_data)
-            imu_error = math.sqrt(
-                (imu_corrected['latitude'] - expected_lat)**2 +
-                (imu_corrected['longitude'] - expected_lon)**2
-            ) * 111000
-            imu_errors.append(imu_error)
+            imu_positions.append((imu_corrected['latitude'], imu_corrected['longitude']))
         
         prev_point = gps_point
     
-    if gps_only_errors and imu_errors:
-        avg_gps_error = sum(gps_only_errors) / len(gps_only_errors)
-        avg_imu_error = sum(imu_errors) / len(imu_errors)
+    if expected_positions:
+        expected = np.array(expected_positions).T
+        # Great-circle errors in meters (a flat 111 km per degree would
+        # overstate longitude errors away from the equator)
+        gps_only_errors = haversine_distance_batch(*expected, *np.array(gps_only_positions).T)
+        imu_errors = haversine_distance_batch(*expected, *np.array(imu_positions).T)
+        avg_gps_error = gps_only_errors.mean()
+        avg_imu_error = imu_errors.mean()
         
         print(f" Average GPS-only correction error: {avg_gps_error:.2f} meters")
         print(f" Average IMU-enhanced correction error: {avg_imu_error:.2f} meters")
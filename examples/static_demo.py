@@ -11,11 +11,12 @@ def static_demo():
     print("Creating guaranteed visible GPS spoofing demo...")
     
     # Create sample GPS data
-    latitudes = [37.7749, 37.7750, 37.7751, 37.7752, 37.7753, 37.7763, 37.7764, 37.7765]
-    longitudes = [-122.4194, -122.4195, -122.4196, -122.4197, -122.4198, -122.4208, -122.4209, -122.4210]
+    latitudes = np.array([37.7749, 37.7750, 37.7751, 37.7752, 37.7753, 37.7763, 37.7764, 37.7765])
+    longitudes = np.array([-122.4194, -122.4195, -122.4196, -122.4197, -122.4198, -122.4208, -122.4209, -122.4210])
     
     # Mark spoofing events (sudden jumps)
-    spoofed_indices = [5, 6]  # Points 5 and 6 show spoofing
+    spoofed = np.zeros(len(latitudes), dtype=bool)
+    spoofed[[5, 6]] = True  # Points 5 and 6 show spoofing
     
     # Create the plot
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -24,16 +25,12 @@ def static_demo():
     ax.plot(longitudes, latitudes, 'b-', linewidth=2, label='GPS Path')
     
     # Mark spoofed points
-    spoofed_lats = [latitudes[i] for i in spoofed_indices]
-    spoofed_lons = [longitudes[i] for i in spoofed_indices]
-    ax.scatter(spoofed_lons, spoofed_lats, c='red', s=100, marker='o', 
-               label='Detected Spoofing', zorder=5)
+    ax.plot(longitudes[spoofed], latitudes[spoofed], linestyle='None', marker='o',
+            markersize=10, color='red', label='Detected Spoofing', zorder=5)
     
     # Mark normal points
-    normal_indices = [i for i in range(len(latitudes)) if i not in spoofed_indices]
-    normal_lats = [latitudes[i] for i in normal_indices]
-    normal_lons = [longitudes[i] for i in normal_indices]
-    ax.scatter(normal_lons, normal_lats, c='blue', s=50, alpha=0.7, label='Normal GPS')
+    ax.plot(longitudes[~spoofed], latitudes[~spoofed], linestyle='None', marker='o',
+            markersize=7, color='blue', alpha=0.7, label='Normal GPS')
     
     # Configure the plot
     ax.set_xlabel('Longitude', fontsize=12)
@@ -45,8 +42,8 @@ def static_demo():
     # Set reasonable axis limits
     lat_padding = 0.001
     lon_padding = 0.001
-    ax.set_xlim(min(longitudes) - lon_padding, max(longitudes) + lon_padding)
-    ax.set_ylim(min(latitudes) - lat_padding, max(latitudes) + lat_padding)
+    ax.set_xlim(longitudes.min() - lon_padding, longitudes.max() + lon_padding)
+    ax.set_ylim(latitudes.min() - lat_padding, latitudes.max() + lat_padding)
     
     # Force window to front (Windows specific)
     try:
@@ -28,7 +28,7 @@ from .correction.path_corrector import PathCorrector
 from .correction.imu_handler import EnhancedIMUHandler, IMUData
 from .streaming.gps_reader import GpsReader
 from .streaming.imu_streamer import EnhancedGpsReader, IMUStreamer
-from .visualization.live_plotter import LivePathPlotter
+from .types import GPSPoint, GpsTrack
 
 __all__ = [
     "VelocityAnomalyDetector",
@@ -38,5 +38,16 @@ __all__ = [
     "GpsReader",
     "EnhancedGpsReader",
     "IMUStreamer",
-    "LivePathPlotter"
-]
\ No newline at end of file
+    "LivePathPlotter",
+    "GPSPoint",
+    "GpsTrack"
+]
+
+
+def __getattr__(name):
+    # Plotting pulls in matplotlib, which dominates import time; load it
+    # only when LivePathPlotter is actually used
+    if name == "LivePathPlotter":
+        from .visualization.live_plotter import LivePathPlotter
+        return LivePathPlotter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,15 +6,9 @@ import sys
 import csv
 from typing import Dict, Any
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    plt = None
-
 from .detectors import VelocityAnomalyDetector
 from .correction import PathCorrector
 from .streaming import GpsReader, MockGpsGenerator
-from .visualization import LivePathPlotter
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -78,6 +72,13 @@ Examples:
         help='Plot update interval in milliseconds (default: 100)'
     )
     
+    parser.add_argument(
+        '--plot-backend',
+        choices=['matplotlib', 'pyqtgraph'],
+        default='matplotlib',
+        help='Rendering backend for the live plot (default: matplotlib)'
+    )
+    
     parser.add_argument(
         '--no-plot',
         action='store_true',
@@ -134,7 +135,9 @@ def run_detection_system(args: argparse.Namespace) -> None:
     plotter = None
     if not args.no_plot:
         logger.info("Setting up live visualization...")
-        plotter = LivePathPlotter(max_points=args.max_points)
+        # Imported here so --no-plot runs never load matplotlib
+        from .visualization import LivePathPlotter
+        plotter = LivePathPlotter(max_points=args.max_points, backend=args.plot_backend)
         plotter.setup_plot()
     
     logger.info("Starting GPS data processing...")
@@ -151,17 +154,17 @@ def run_detection_system(args: argparse.Namespace) -> None:
             detector.previous_point = previous_point
             is_spoofed = detector.detect(current_point)
             
-            # Correct if spoofed
+            # Correct if spoofed, otherwise record as last valid position
             corrected_point = None
             if is_spoofed:
-                corrected_point = corrector.correct(
-                    current_point, is_spoofed=is_spoofed
-                )
+                corrected_point = corrector.correct_spoofed(current_point)
                 spoofed_count += 1
                 logger.warning(
                     f"Spoofing detected at point {total_points}: "
                     f"({current_point['latitude']:.6f}, {current_point['longitude']:.6f})"
                 )
+            else:
+                corrector.correct_valid(current_point)
             
             # Update visualization
             if plotter:
@@ -197,7 +200,8 @@ def run_detection_system(args: argparse.Namespace) -> None:
     finally:
         if plotter:
             plotter.close()
-            if plt and not args.no_plot:
+            if args.plot_backend == 'matplotlib':
+                import matplotlib.pyplot as plt
                 plt.show()
                 input("Press Enter to exit...")
         
@@ -231,10 +235,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
-
-# Import plt for graceful shutdown handling
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    plt = None
\ No newline at end of file
@@ -4,7 +4,9 @@ This module provides various strategies for correcting GPS paths when
 spoofing is detected, including dead reckoning and fallback methods.
 """
 
-from .path_corrector import PathCorrector
-from .dead_reckoner import DeadReckoner
+from .path_corrector import PathCorrector, GPS_POINT_DTYPE, IMU_SAMPLE_DTYPE, correct_sessions
+from .dead_reckoner import DeadReckoner, PreintegratedImu
+from .imu_handler import IMU_DTYPE, stack_imu_data
 
-__all__ = ["PathCorrector", "DeadReckoner"]
\ No newline at end of file
+__all__ = ["PathCorrector", "DeadReckoner", "PreintegratedImu", "GPS_POINT_DTYPE", "IMU_SAMPLE_DTYPE",
+           "IMU_DTYPE", "stack_imu_data", "correct_sessions"]
\ No newline at end of file
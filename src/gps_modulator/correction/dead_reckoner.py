@@ -1,7 +1,86 @@
 """Dead reckoning navigation for GPS path correction."""
 
 import math
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from ..utils._jit import njit, FASTMATH
+from ..utils.gps_math import EARTH_RADIUS as _EARTH_RADIUS, _DEG2RAD, _RAD2DEG, _point_latlon
+
+# Below this angular distance (about 10 km) sin/cos are evaluated with a
+# truncated Taylor series; the first dropped term is under 1e-20
+_SMALL_ANGLE = 1.6e-3
+
+
+@dataclass
+class PreintegratedImu:
+    """
+    IMU motion accumulated between two GPS fixes.
+    
+    Samples are folded into a handful of running sums that do not depend
+    on the starting position or speed, so a burst of high-rate IMU samples
+    can be applied to a DeadReckoner in one step with ``apply_preintegrated``.
+    Displacements are kept in a local north/east frame in meters.
+    
+    Attributes:
+        delta_time (float): Total integrated time in seconds
+        delta_velocity (float): Speed change from accelerations in m/s
+        north_per_velocity (float): North displacement per m/s of initial speed
+        east_per_velocity (float): East displacement per m/s of initial speed
+        north (float): North displacement due to accelerations in meters
+        east (float): East displacement due to accelerations in meters
+    """
+    
+    delta_time: float = 0.0
+    delta_velocity: float = 0.0
+    north_per_velocity: float = 0.0
+    east_per_velocity: float = 0.0
+    north: float = 0.0
+    east: float = 0.0
+    
+    def integrate(self, heading: float, delta_time: float, acceleration: float = 0.0) -> None:
+        """
+        Add one IMU sample, with the same semantics as ``DeadReckoner.update``.
+        
+        Args:
+            heading: Heading in degrees (0-360, where 0 is North)
+            delta_time: Time elapsed since the previous sample in seconds
+            acceleration: Acceleration in m/s² (default: 0.0)
+        """
+        heading_rad = heading * _DEG2RAD
+        north_unit = math.cos(heading_rad) * delta_time
+        east_unit = math.sin(heading_rad) * delta_time
+        
+        self.delta_velocity += acceleration * delta_time
+        self.north_per_velocity += north_unit
+        self.east_per_velocity += east_unit
+        self.north += self.delta_velocity * north_unit
+        self.east += self.delta_velocity * east_unit
+        self.delta_time += delta_time
+    
+    def displacement(self, initial_velocity: float) -> Tuple[float, float]:
+        """
+        North/east displacement in meters for a given starting speed.
+        
+        Args:
+            initial_velocity: Speed at the start of the interval in m/s
+        
+        Returns:
+            Tuple[float, float]: (north, east) displacement in meters
+        """
+        return (initial_velocity * self.north_per_velocity + self.north,
+                initial_velocity * self.east_per_velocity + self.east)
+    
+    def reset(self) -> None:
+        """Clear the accumulated motion."""
+        self.delta_time = 0.0
+        self.delta_velocity = 0.0
+        self.north_per_velocity = 0.0
+        self.east_per_velocity = 0.0
+        self.north = 0.0
+        self.east = 0.0
 
 
 class DeadReckoner:
@@ -17,7 +96,11 @@ class DeadReckoner:
         earth_radius (float): Earth's radius in meters
     """
     
-    EARTH_RADIUS = 6371000.0  # Earth's radius in meters
+    __slots__ = ('current_position', 'current_velocity',
+                 '_last_heading', '_sin_heading', '_cos_heading',
+                 '_trig_lat', '_sin_lat')
+    
+    EARTH_RADIUS = _EARTH_RADIUS  # Earth's radius in meters
     
     def __init__(self, initial_position: Dict[str, float], initial_velocity: float = 0.0) -> None:
         """
@@ -29,13 +112,33 @@ class DeadReckoner:
                 - 'longitude' (float): Initial longitude in decimal degrees
             initial_velocity: Initial velocity in m/s (default: 0.0)
         """
-        self.current_position = {
-            'latitude': float(initial_position.get('latitude', initial_position.get('lat', 0.0))),
-            'longitude': float(initial_position.get('longitude', initial_position.get('lon', 0.0)))
-        }
+        lat, lon = _point_latlon(initial_position)
+        self.current_position = {'latitude': lat, 'longitude': lon}
         self.current_velocity = float(initial_velocity)
+        
+        # sin/cos of the last heading seen; headings rarely change between
+        # ticks on straight segments
+        self._last_heading: Optional[float] = None
+        self._sin_heading = 0.0
+        self._cos_heading = 1.0
+        
+        # sin of the current latitude, carried over from the previous step
+        self._trig_lat: Optional[float] = None
+        self._sin_lat = 0.0
+    
+    def _heading_trig(self, heading: float) -> Tuple[float, float]:
+        """Return (sin, cos) of a heading in degrees, cached per heading."""
+        if heading != self._last_heading:
+            heading_rad = heading * _DEG2RAD
+            self._sin_heading = math.sin(heading_rad)
+            self._cos_heading = math.cos(heading_rad)
+            self._last_heading = heading
+        return self._sin_heading, self._cos_heading
     
-    def update(self, imu_data: Dict[str, float], delta_time: float) -> Dict[str, float]:
+    def update(self,
+               imu_data: Dict[str, float],
+               delta_time: float,
+               out: Optional[Dict[str, float]] = None) -> Dict[str, float]:
         """
         Update position based on IMU data.
         
@@ -45,27 +148,133 @@ class DeadReckoner:
                 - 'speed' (float): Speed in m/s
                 - 'acceleration' (float): Optional acceleration in m/s²
             delta_time: Time elapsed since last update in seconds
+            out: Optional dictionary to write the updated position into,
+                so callers updating at a high rate can reuse one dict
         
         Returns:
             Dict[str, float]: Updated position with 'latitude' and 'longitude'
+                (``out`` itself when given, otherwise a new dictionary)
         """
         # Update velocity based on acceleration if available
-        if 'acceleration' in imu_data:
-            acceleration = float(imu_data['acceleration'])
-            self.current_velocity += acceleration * delta_time
-        else:
+        acceleration = imu_data.get('acceleration')
+        if acceleration is None:
             # Use provided speed directly
             self.current_velocity = float(imu_data.get('speed', self.current_velocity))
+            acceleration = 0.0
+        
+        sin_heading, cos_heading = self._heading_trig(float(imu_data['heading']))
         
-        heading = float(imu_data['heading'])
-        distance = self.current_velocity * delta_time
+        position = self.current_position
+        lat = position['latitude']
+        if lat != self._trig_lat:
+            # Position was set externally since the last step
+            self._sin_lat = math.sin(lat * _DEG2RAD)
         
-        next_position = self.compute_next_position(
-            self.current_position, heading, distance
+        lat, lon, self._sin_lat, self.current_velocity = _dr_step(
+            self._sin_lat, position['longitude'],
+            self.current_velocity, float(acceleration), sin_heading, cos_heading,
+            float(delta_time), self.EARTH_RADIUS
         )
+        self._trig_lat = lat
         
-        self.current_position = next_position
-        return next_position.copy()
+        position['latitude'] = lat
+        position['longitude'] = lon
+        
+        if out is None:
+            return position.copy()
+        out['latitude'] = lat
+        out['longitude'] = lon
+        return out
+    
+    def update_batch(self,
+                     headings: np.ndarray,
+                     delta_times: np.ndarray,
+                     accelerations: Optional[np.ndarray] = None,
+                     speeds: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply a sequence of IMU updates at once.
+        
+        Equivalent to calling ``update`` once per sample: velocity is
+        integrated from accelerations when given, otherwise taken from
+        speeds (or held constant). Positions are accumulated in a local
+        north/east frame, using the mid-step latitude for the longitude
+        scale, which matches the great-circle steps of ``update`` closely
+        for the short distances covered between IMU samples.
+        
+        Args:
+            headings: Headings in degrees (0-360, where 0 is North)
+            delta_times: Time elapsed before each sample in seconds
+            accelerations: Optional accelerations in m/s²
+            speeds: Optional speeds in m/s (used when no accelerations)
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Positions after each sample as
+                (latitudes, longitudes) in decimal degrees
+        """
+        heading_rad = np.radians(np.asarray(headings, dtype=np.float64))
+        dts = np.asarray(delta_times, dtype=np.float64)
+        if heading_rad.size == 0:
+            return np.empty(0), np.empty(0)
+        
+        if accelerations is not None:
+            velocity = np.cumsum(np.asarray(accelerations, dtype=np.float64) * dts)
+            velocity += self.current_velocity
+        elif speeds is not None:
+            velocity = np.asarray(speeds, dtype=np.float64)
+        else:
+            velocity = np.full(dts.shape, self.current_velocity)
+        
+        distance = velocity * dts
+        
+        lat0 = self.current_position['latitude']
+        lon0 = self.current_position['longitude']
+        
+        # North component, then east component scaled at mid-step latitude
+        lats = np.cumsum(distance * np.cos(heading_rad))
+        lats *= math.degrees(1.0 / self.EARTH_RADIUS)
+        lats += lat0
+        mid_lats = np.empty_like(lats)
+        mid_lats[0] = lat0
+        mid_lats[1:] = lats[:-1]
+        mid_lats += lats
+        mid_lats *= 0.5
+        
+        lons = np.cumsum(distance * np.sin(heading_rad) / np.cos(np.radians(mid_lats)))
+        lons *= math.degrees(1.0 / self.EARTH_RADIUS)
+        lons += lon0
+        lons = (lons + 180) % 360 - 180
+        
+        self.current_velocity = float(velocity[-1])
+        self.current_position = {'latitude': float(lats[-1]), 'longitude': float(lons[-1])}
+        
+        return lats, lons
+    
+    def apply_preintegrated(self, preintegrated: PreintegratedImu) -> Dict[str, float]:
+        """
+        Advance the position by IMU motion accumulated between GPS fixes.
+        
+        Equivalent to calling ``update`` for every sample folded into
+        ``preintegrated``; the displacement is applied in the local
+        north/east frame at the mid-interval latitude, like ``update_batch``.
+        
+        Args:
+            preintegrated: Accumulated IMU motion
+        
+        Returns:
+            Dict[str, float]: Updated position with 'latitude' and 'longitude'
+        """
+        north, east = preintegrated.displacement(self.current_velocity)
+        
+        position = self.current_position
+        lat = position['latitude']
+        new_lat = lat + north / self.EARTH_RADIUS * _RAD2DEG
+        mid_lat_rad = 0.5 * (lat + new_lat) * _DEG2RAD
+        new_lon = position['longitude'] + east / (self.EARTH_RADIUS * math.cos(mid_lat_rad)) * _RAD2DEG
+        
+        position['latitude'] = new_lat
+        position['longitude'] = ((new_lon + 180) % 360) - 180
+        self.current_velocity += preintegrated.delta_velocity
+        return position.copy()
     
     def compute_next_position(self, 
                              present_position: Dict[str, float],
@@ -83,37 +292,50 @@ class DeadReckoner:
             Dict[str, float]: Next position with 'latitude' and 'longitude'
         """
         # Extract coordinates with fallback for different key names
-        lat = float(present_position.get('latitude', present_position.get('lat', 0.0)))
-        lon = float(present_position.get('longitude', present_position.get('lon', 0.0)))
+        lat, lon = _point_latlon(present_position)
         
-        # Convert to radians
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        heading_rad = math.radians(heading)
+        sin_heading, cos_heading = self._heading_trig(float(heading))
+        new_lat, new_lon = _destination(lat * _DEG2RAD, lon * _DEG2RAD,
+                                        sin_heading, cos_heading,
+                                        float(distance) / self.EARTH_RADIUS)
         
-        # Calculate angular distance
-        angular_distance = distance / self.EARTH_RADIUS
+        return {'latitude': new_lat, 'longitude': new_lon}
+    
+    @classmethod
+    def compute_next_positions(cls,
+                               lat: np.ndarray,
+                               lon: np.ndarray,
+                               heading: np.ndarray,
+                               distance: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized compute_next_position over arrays of start points.
         
-        # Calculate new latitude
-        new_lat_rad = math.asin(
-            math.sin(lat_rad) * math.cos(angular_distance) +
-            math.cos(lat_rad) * math.sin(angular_distance) * math.cos(heading_rad)
-        )
+        Args:
+            lat: Starting latitudes in decimal degrees
+            lon: Starting longitudes in decimal degrees
+            heading: Headings in degrees (0-360, where 0 is North)
+            distance: Distances to travel in meters
         
-        # Calculate new longitude
-        new_lon_rad = lon_rad + math.atan2(
-            math.sin(heading_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-            math.cos(angular_distance) - math.sin(lat_rad) * math.sin(new_lat_rad)
-        )
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Next (latitudes, longitudes)
+        """
+        lat_rad = np.radians(lat)
+        heading_rad = np.radians(heading)
+        angular_distance = np.asarray(distance, dtype=np.float64) / cls.EARTH_RADIUS
         
-        # Convert back to degrees
-        new_lat = math.degrees(new_lat_rad)
-        new_lon = math.degrees(new_lon_rad)
+        sin_lat = np.sin(lat_rad)
+        cos_lat = np.cos(lat_rad)
+        sin_ad = np.sin(angular_distance)
+        cos_ad = np.cos(angular_distance)
         
-        # Normalize longitude to -180 to 180 range
-        new_lon = ((new_lon + 180) % 360) - 180
+        new_lat_rad = np.arcsin(sin_lat * cos_ad + cos_lat * sin_ad * np.cos(heading_rad))
+        new_lon = lon + np.degrees(np.arctan2(
+            np.sin(heading_rad) * sin_ad * cos_lat,
+            cos_ad - sin_lat * np.sin(new_lat_rad)
+        ))
         
-        return {'latitude': new_lat, 'longitude': new_lon}
+        # Normalize longitude to -180 to 180 range
+        return np.degrees(new_lat_rad), (new_lon + 180) % 360 - 180
     
     def get_current_position(self) -> Dict[str, float]:
         """Get the current estimated position."""
@@ -131,8 +353,56 @@ class DeadReckoner:
             new_position: New position to reset to (optional)
         """
         if new_position is not None:
-            self.current_position = {
-                'latitude': float(new_position.get('latitude', new_position.get('lat', 0.0))),
-                'longitude': float(new_position.get('longitude', new_position.get('lon', 0.0)))
-            }
-        self.current_velocity = 0.0
\ No newline at end of file
+            lat, lon = _point_latlon(new_position)
+            self.current_position = {'latitude': lat, 'longitude': lon}
+        self.current_velocity = 0.0
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _destination_trig(sin_lat, lon_rad, sin_heading, cos_heading, angular_distance):
+    """
+    Great-circle destination from the sine of the start latitude.
+    
+    Returns the new latitude and longitude in degrees (longitude
+    normalized) and the sine of the new latitude, so consecutive steps
+    never need sin/cos of the latitude itself.
+    """
+    cos_lat = math.sqrt(max(0.0, 1.0 - sin_lat * sin_lat))
+    if -_SMALL_ANGLE < angular_distance < _SMALL_ANGLE:
+        ad_sq = angular_distance * angular_distance
+        sin_ad = angular_distance * (1.0 - ad_sq / 6.0 * (1.0 - ad_sq / 20.0))
+        cos_ad = 1.0 - ad_sq / 2.0 * (1.0 - ad_sq / 12.0)
+    else:
+        sin_ad = math.sin(angular_distance)
+        cos_ad = math.cos(angular_distance)
+    
+    # Calculate new latitude
+    new_sin_lat = sin_lat * cos_ad + cos_lat * sin_ad * cos_heading
+    
+    # Calculate new longitude
+    new_lon_rad = lon_rad + math.atan2(
+        sin_heading * sin_ad * cos_lat,
+        cos_ad - sin_lat * new_sin_lat
+    )
+    
+    # Convert back to degrees, normalizing longitude to -180 to 180 range
+    new_lon = ((new_lon_rad * _RAD2DEG + 180) % 360) - 180
+    return math.asin(new_sin_lat) * _RAD2DEG, new_lon, new_sin_lat
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _destination(lat_rad, lon_rad, sin_heading, cos_heading, angular_distance):
+    """Great-circle destination point in degrees, longitude normalized."""
+    new_lat, new_lon, _ = _destination_trig(math.sin(lat_rad), lon_rad,
+                                            sin_heading, cos_heading, angular_distance)
+    return new_lat, new_lon
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _dr_step(sin_lat, lon, velocity, acceleration, sin_heading, cos_heading, dt, R):
+    """One dead-reckoning tick: integrate velocity, then move along heading."""
+    velocity += acceleration * dt
+    new_lat, new_lon, new_sin_lat = _destination_trig(sin_lat, lon * _DEG2RAD,
+                                                      sin_heading, cos_heading,
+                                                      velocity * dt / R)
+    return new_lat, new_lon, new_sin_lat, velocity
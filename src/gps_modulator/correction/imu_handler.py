@@ -1,12 +1,19 @@
 """Enhanced IMU data handling and integration for GPS path correction."""
 
 import math
-from typing import Dict, Any, Optional, Tuple
+import operator
+import sys
+from typing import Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import numpy as np
 
+from ..utils.gps_math import _DEG2RAD, _RAD2DEG
 
-@dataclass
+# __slots__ through dataclass() needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class IMUData:
     """Structured IMU data container."""
     
@@ -34,9 +41,46 @@ class IMUData:
     timestamp: float = 0.0
 
 
+# Packed record layout for batches of IMUData (see stack_imu_data)
+IMU_DTYPE = np.dtype([
+    ('acceleration_x', np.float32),
+    ('acceleration_y', np.float32),
+    ('acceleration_z', np.float32),
+    ('gyro_x', np.float32),
+    ('gyro_y', np.float32),
+    ('gyro_z', np.float32),
+    ('mag_x', np.float32),
+    ('mag_y', np.float32),
+    ('mag_z', np.float32),
+    ('heading', np.float32),
+    ('pitch', np.float32),
+    ('roll', np.float32),
+    ('timestamp', np.float64),
+])
+
+_imu_values = operator.attrgetter(*IMU_DTYPE.names)
+
+
+def stack_imu_data(samples: Sequence[IMUData]) -> np.ndarray:
+    """
+    Pack IMUData samples into one contiguous structured array.
+    
+    Args:
+        samples: Processed IMU samples
+    
+    Returns:
+        np.ndarray: Array of dtype IMU_DTYPE, one record per sample
+    """
+    return np.array([_imu_values(sample) for sample in samples], dtype=IMU_DTYPE)
+
+
 class EnhancedIMUHandler:
     """Advanced IMU data processing for improved GPS path correction."""
     
+    __slots__ = ('previous_imu_data', 'magnetic_declination',
+                 'accel_bias', 'gyro_bias', 'mag_bias',
+                 'alpha', 'heading_history', 'max_history')
+    
     def __init__(self) -> None:
         """Initialize the IMU handler."""
         self.previous_imu_data: Optional[IMUData] = None
@@ -141,33 +185,29 @@ class EnhancedIMUHandler:
         accel_norm = accel / np.linalg.norm(accel)
         
         # Calculate pitch and roll
-        pitch = math.degrees(math.atan2(accel_norm[0], math.sqrt(accel_norm[1]**2 + accel_norm[2]**2)))
-        roll = math.degrees(math.atan2(accel_norm[1], math.sqrt(accel_norm[0]**2 + accel_norm[2]**2)))
+        pitch = math.atan2(accel_norm[0], math.sqrt(accel_norm[1]**2 + accel_norm[2]**2)) * _RAD2DEG
+        roll = math.atan2(accel_norm[1], math.sqrt(accel_norm[0]**2 + accel_norm[2]**2)) * _RAD2DEG
         
         return pitch, roll
     
     def _calculate_heading(self, mag: np.ndarray, pitch: float, roll: float) -> float:
         """Calculate heading from magnetometer data with tilt compensation."""
         # Tilt compensation
-        pitch_rad = math.radians(pitch)
-        roll_rad = math.radians(roll)
+        pitch_rad = pitch * _DEG2RAD
+        roll_rad = roll * _DEG2RAD
+        sin_pitch = math.sin(pitch_rad)
+        cos_pitch = math.cos(pitch_rad)
+        sin_roll = math.sin(roll_rad)
+        cos_roll = math.cos(roll_rad)
         
         # Apply tilt compensation
-        mag_x = mag[0] * math.cos(pitch_rad) + mag[2] * math.sin(pitch_rad)
-        mag_y = mag[0] * math.sin(roll_rad) * math.sin(pitch_rad) + \
-                mag[1] * math.cos(roll_rad) - mag[2] * math.sin(roll_rad) * math.cos(pitch_rad)
-        
-        # Calculate heading
-        heading = math.degrees(math.atan2(mag_y, mag_x))
+        mag_x = mag[0] * cos_pitch + mag[2] * sin_pitch
+        mag_y = mag[0] * sin_roll * sin_pitch + \
+                mag[1] * cos_roll - mag[2] * sin_roll * cos_pitch
         
-        # Convert to 0-360 range
-        if heading < 0:
-            heading += 360
-        
-        # Apply magnetic declination correction
-        heading = (heading + self.magnetic_declination) % 360
-        
-        return heading
+        # Calculate heading, apply magnetic declination correction and
+        # convert to 0-360 range in one step
+        return (math.atan2(mag_y, mag_x) * _RAD2DEG + self.magnetic_declination) % 360
     
     def get_motion_vector(self, imu_data: IMUData, delta_time: float) -> Dict[str, float]:
         """
@@ -199,6 +239,12 @@ class EnhancedIMUHandler:
         self.magnetic_declination = declination
 
 
+# Sensor channels produced by MockIMUGenerator, in generation order
+IMU_CHANNELS = ('accel_x', 'accel_y', 'accel_z',
+                'gyro_x', 'gyro_y', 'gyro_z',
+                'mag_x', 'mag_y', 'mag_z')
+
+
 class MockIMUGenerator:
     """Generate simulated IMU data for testing."""
     
@@ -224,21 +270,75 @@ class MockIMUGenerator:
         # Update heading
         self.current_heading = (self.current_heading + heading_change * delta_time) % 360
         
-        # Add noise
-        noise = lambda: np.random.normal(0, self.noise_level)
+        # Add noise (drawn in one call for all nine channels)
+        noise = np.random.normal(0, self.noise_level, 9).tolist()
+        heading_rad = self.current_heading * _DEG2RAD
         
         data = {
-            'accel_x': noise(),
-            'accel_y': noise(),
-            'accel_z': 9.81 + noise(),  # Gravity
-            'gyro_x': noise(),
-            'gyro_y': noise(),
-            'gyro_z': heading_change + noise(),
-            'mag_x': math.cos(math.radians(self.current_heading)) + noise(),
-            'mag_y': math.sin(math.radians(self.current_heading)) + noise(),
-            'mag_z': 0.5 + noise(),
+            'accel_x': noise[0],
+            'accel_y': noise[1],
+            'accel_z': 9.81 + noise[2],  # Gravity
+            'gyro_x': noise[3],
+            'gyro_y': noise[4],
+            'gyro_z': heading_change + noise[5],
+            'mag_x': math.cos(heading_rad) + noise[6],
+            'mag_y': math.sin(heading_rad) + noise[7],
+            'mag_z': 0.5 + noise[8],
             'timestamp': timestamp
         }
         
         self.last_timestamp = timestamp
-        return data
\ No newline at end of file
+        return data
+    
+    def generate_batch(self,
+                       timestamps: np.ndarray,
+                       heading_changes: np.ndarray,
+                       out: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+        """
+        Generate a block of mock IMU samples in structure-of-arrays form.
+        
+        Equivalent to calling ``generate_data`` once per timestamp, but
+        returns one array per channel instead of one dict per sample.
+        
+        Args:
+            timestamps: Sample timestamps, increasing
+            heading_changes: Change in heading per sample (degrees/second)
+            out: Optional dict of arrays (as returned by a previous call with
+                the same length) to fill in place instead of allocating
+        
+        Returns:
+            Dict[str, np.ndarray]: float32 arrays for each sensor channel in
+                IMU_CHANNELS and a float64 'timestamp' array
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        heading_changes = np.asarray(heading_changes, dtype=np.float64)
+        n = timestamps.shape[0]
+        
+        if out is None:
+            out = {name: np.empty(n, dtype=np.float32) for name in IMU_CHANNELS}
+            out['timestamp'] = np.empty(n, dtype=np.float64)
+        if n == 0:
+            return out
+        
+        delta_times = np.empty(n)
+        delta_times[0] = timestamps[0] - self.last_timestamp if self.last_timestamp > 0 else 0.1
+        np.subtract(timestamps[1:], timestamps[:-1], out=delta_times[1:])
+        
+        headings = np.cumsum(heading_changes * delta_times)
+        headings += self.current_heading
+        np.mod(headings, 360, out=headings)
+        heading_rad = np.radians(headings)
+        
+        noise = np.random.normal(0, self.noise_level, (len(IMU_CHANNELS), n))
+        noise[2] += 9.81  # Gravity
+        noise[5] += heading_changes
+        noise[6] += np.cos(heading_rad)
+        noise[7] += np.sin(heading_rad)
+        noise[8] += 0.5
+        for name, values in zip(IMU_CHANNELS, noise):
+            out[name][:] = values
+        out['timestamp'][:] = timestamps
+        
+        self.current_heading = float(headings[-1])
+        self.last_timestamp = float(timestamps[-1])
+        return out
\ No newline at end of file
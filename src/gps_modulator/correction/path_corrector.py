@@ -1,9 +1,25 @@
 """GPS path correction using dead reckoning and fallback strategies."""
 
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..types import GPSPoint
 from .dead_reckoner import DeadReckoner
 from .imu_handler import EnhancedIMUHandler, IMUData
 
+# Structure-of-arrays layouts used by PathCorrector.correct_batch
+GPS_POINT_DTYPE = np.dtype([
+    ('latitude', np.float64),
+    ('longitude', np.float64),
+    ('timestamp', np.float64),
+])
+IMU_SAMPLE_DTYPE = np.dtype([
+    ('heading', np.float64),
+    ('speed', np.float64),
+])
+
 
 class PathCorrector:
     """
@@ -14,13 +30,16 @@ class PathCorrector:
     fallback to the last known good position.
     
     Attributes:
-        last_valid_position (Optional[Dict[str, float]]): Last known good GPS position
+        last_valid_position (Optional[GPSPoint]): Last known good GPS position
         dead_reckoner (Optional[DeadReckoner]): Dead reckoning calculator
     """
     
+    __slots__ = ('last_valid_position', 'dead_reckoner', 'imu_handler',
+                 'use_imu_correction', 'imu_calibration_data')
+    
     def __init__(self) -> None:
         """Initialize the path corrector."""
-        self.last_valid_position: Optional[Dict[str, float]] = None
+        self.last_valid_position: Optional[GPSPoint] = None
         self.dead_reckoner: Optional[DeadReckoner] = None
         self.imu_handler: Optional[EnhancedIMUHandler] = None
         self.use_imu_correction: bool = False  # Default to False
@@ -29,12 +48,12 @@ class PathCorrector:
     def correct(self, 
                 current_point: Dict[str, Any], 
                 is_spoofed: bool = False,
-                imu_data: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+                imu_data: Optional[Dict[str, float]] = None) -> Union[GPSPoint, Dict[str, Any]]:
         """
         Correct a GPS point if it's detected as spoofed.
         
         Args:
-            current_point: Dictionary with GPS data containing:
+            current_point: GPSPoint or dictionary with GPS data containing:
                 - 'latitude' (float): Latitude in decimal degrees
                 - 'longitude' (float): Longitude in decimal degrees  
                 - 'timestamp' (float): Unix timestamp
@@ -45,29 +64,151 @@ class PathCorrector:
                 - 'acceleration' (float): Optional acceleration in m/s²
         
         Returns:
-            Dict[str, float]: Corrected GPS coordinates with keys:
-                'latitude', 'longitude', 'timestamp'
+            Union[GPSPoint, Dict[str, Any]]: Corrected GPS coordinates with
+                keys 'latitude', 'longitude', 'timestamp'. Accepted points are
+                returned as an immutable GPSPoint (also kept as
+                last_valid_position); corrected points are dictionaries that
+                additionally carry 'confidence' and 'correction_method'.
         """
-        if self.last_valid_position is None:
-            self.last_valid_position = {
-                'latitude': current_point['latitude'],
-                'longitude': current_point['longitude'],
-                'timestamp': current_point['timestamp']
-            }
-            return self.last_valid_position.copy()
-        
-        if not is_spoofed:
-            # Point is valid, update last known position
-            self.last_valid_position = {
-                'latitude': current_point['latitude'],
-                'longitude': current_point['longitude'],
-                'timestamp': current_point['timestamp']
-            }
-            return self.last_valid_position.copy()
+        if not is_spoofed or self.last_valid_position is None:
+            # Point is valid (or the first one seen), update last known position
+            return self.correct_valid(current_point)
         
         # Point is spoofed, apply correction
         return self._apply_correction(current_point, imu_data)
     
+    def correct_valid(self, current_point: Dict[str, Any]) -> GPSPoint:
+        """
+        Accept a GPS point known to be genuine.
+        
+        Same as ``correct(current_point, is_spoofed=False)`` without the
+        dispatch, for callers that already branch on the detector result.
+        
+        Args:
+            current_point: GPSPoint or dictionary with 'latitude',
+                'longitude' and 'timestamp'
+        
+        Returns:
+            GPSPoint: The accepted point, now the last valid position
+        """
+        if type(current_point) is GPSPoint and not current_point.is_spoofed:
+            new_position = current_point
+        else:
+            new_position = GPSPoint(current_point['latitude'],
+                                    current_point['longitude'],
+                                    current_point['timestamp'])
+        self.last_valid_position = new_position
+        return new_position
+    
+    def correct_spoofed(self,
+                        current_point: Dict[str, Any],
+                        imu_data: Optional[Dict[str, float]] = None) -> Union[GPSPoint, Dict[str, Any]]:
+        """
+        Correct a GPS point detected as spoofed.
+        
+        Same as ``correct(current_point, is_spoofed=True, imu_data=imu_data)``.
+        
+        Args:
+            current_point: GPSPoint or dictionary with 'latitude',
+                'longitude' and 'timestamp'
+            imu_data: Optional IMU data dictionary (see ``correct``)
+        
+        Returns:
+            Union[GPSPoint, Dict[str, Any]]: Corrected coordinates, or the
+                point itself if no valid position has been seen yet
+        """
+        if self.last_valid_position is None:
+            return self.correct_valid(current_point)
+        return self._apply_correction(current_point, imu_data)
+    
+    def correct_batch(self,
+                      points: np.ndarray,
+                      is_spoofed: np.ndarray,
+                      imu: Optional[np.ndarray] = None,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Correct a batch of GPS points stored as structured arrays.
+        
+        Equivalent to calling ``correct`` point by point with basic dead
+        reckoning, but without per-point dict allocation: spoofed points are
+        projected from the last valid point before them in one vectorized
+        step. When IMU-enhanced correction is enabled the stateful per-point
+        path is used instead.
+        
+        Args:
+            points: Structured array with 'latitude', 'longitude' and
+                'timestamp' fields (e.g. GPS_POINT_DTYPE)
+            is_spoofed: Boolean array, True where a point is spoofed
+            imu: Optional structured array with 'heading' and 'speed' fields
+                (IMU_SAMPLE_DTYPE); NaN entries fall back to position hold
+            out: Optional GPS_POINT_DTYPE array to write results into
+        
+        Returns:
+            np.ndarray: Corrected points as a GPS_POINT_DTYPE array
+        """
+        n = len(points)
+        if out is None:
+            out = np.empty(n, dtype=GPS_POINT_DTYPE)
+        if n == 0:
+            return out
+        
+        lat = points['latitude']
+        lon = points['longitude']
+        ts = points['timestamp']
+        valid = ~np.asarray(is_spoofed, dtype=np.bool_)
+        
+        if self.use_imu_correction and imu is not None:
+            for i in range(n):
+                imu_data = None
+                if not (np.isnan(imu['heading'][i]) or np.isnan(imu['speed'][i])):
+                    imu_data = {'heading': float(imu['heading'][i]),
+                                'speed': float(imu['speed'][i])}
+                corrected = self.correct(
+                    {'latitude': float(lat[i]), 'longitude': float(lon[i]),
+                     'timestamp': float(ts[i])},
+                    not valid[i], imu_data
+                )
+                out[i] = (corrected['latitude'], corrected['longitude'], corrected['timestamp'])
+            return out
+        
+        # Slot 0 holds the carried-over last valid position (if any)
+        prev = self.last_valid_position
+        if prev is None:
+            valid[0] = True
+            prev = GPSPoint(0.0, 0.0, 0.0)
+        
+        # Index of the most recent valid point at or before each sample
+        ref = np.where(valid, np.arange(1, n + 1), 0)
+        np.maximum.accumulate(ref, out=ref)
+        ref_lat = np.concatenate(([prev['latitude']], lat))[ref]
+        ref_lon = np.concatenate(([prev['longitude']], lon))[ref]
+        ref_ts = np.concatenate(([prev['timestamp']], ts))[ref]
+        
+        # Position hold, replaced by dead reckoning where IMU data exists
+        corrected_lat = ref_lat
+        corrected_lon = ref_lon
+        if imu is not None:
+            heading = imu['heading']
+            speed = imu['speed']
+            dr_lat, dr_lon = DeadReckoner.compute_next_positions(
+                ref_lat, ref_lon, heading, speed * (ts - ref_ts)
+            )
+            has_imu = ~(np.isnan(heading) | np.isnan(speed))
+            corrected_lat = np.where(has_imu, dr_lat, ref_lat)
+            corrected_lon = np.where(has_imu, dr_lon, ref_lon)
+        
+        out['latitude'] = np.where(valid, lat, corrected_lat)
+        out['longitude'] = np.where(valid, lon, corrected_lon)
+        out['timestamp'] = ts
+        
+        last = ref[-1]
+        if last:
+            self.last_valid_position = GPSPoint(float(lat[last - 1]),
+                                                float(lon[last - 1]),
+                                                float(ts[last - 1]))
+        
+        return out
+    
     def _apply_correction(self, 
                          current_point: Dict[str, Any],
                          imu_data: Optional[Dict[str, float]]) -> Dict[str, float]:
@@ -116,7 +257,8 @@ class PathCorrector:
             time_delta = current_point['timestamp'] - self.last_valid_position['timestamp']
             
             if time_delta <= 0:
-                return self.last_valid_position.copy()
+                # A copy, so callers cannot reach the stored position
+                return self.last_valid_position.to_dict()
             
             # Get motion vector from enhanced IMU processing
             motion_vector = self.imu_handler.get_motion_vector(processed_imu, time_delta)
@@ -128,17 +270,20 @@ class PathCorrector:
                     initial_velocity=motion_vector.get('speed', 0.0)
                 )
             
-            # Update dead reckoner with IMU data
-            corrected = self.dead_reckoner.update(processed_imu.__dict__, time_delta)
-            
-            return {
-                'latitude': corrected['latitude'],
-                'longitude': corrected['longitude'],
+            corrected = {
+                'latitude': 0.0,
+                'longitude': 0.0,
                 'timestamp': current_point['timestamp'],
                 'confidence': 0.9,  # High confidence with IMU data
                 'correction_method': 'imu_enhanced'
             }
             
+            # Update dead reckoner with IMU data, writing the position
+            # straight into the returned dict
+            self.dead_reckoner.update({'heading': processed_imu.heading}, time_delta,
+                                      out=corrected)
+            return corrected
+            
         except Exception as e:
             # Fallback to basic correction on IMU processing errors
             return self._apply_basic_correction(current_point, imu_data)
@@ -190,4 +335,27 @@ class PathCorrector:
         if self.imu_handler:
             self.imu_handler = EnhancedIMUHandler()
             if self.imu_calibration_data:
-                self.imu_handler.calibrate(self.imu_calibration_data)
\ No newline at end of file
+                self.imu_handler.calibrate(self.imu_calibration_data)
+
+
+def correct_sessions(sessions: Sequence[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]
+                     ) -> List[np.ndarray]:
+    """
+    Correct several independent recorded sessions in parallel.
+    
+    Each session gets its own PathCorrector and is processed with
+    ``correct_batch`` on a thread pool that lives for the duration of the
+    call; the NumPy kernels release the GIL, so sessions overlap on
+    multi-core machines.
+    
+    Args:
+        sessions: Sequence of ``(points, is_spoofed, imu)`` tuples as
+            accepted by ``PathCorrector.correct_batch`` (imu may be None)
+    
+    Returns:
+        List[np.ndarray]: Corrected GPS_POINT_DTYPE arrays, in session order
+    """
+    if len(sessions) <= 1:
+        return [PathCorrector().correct_batch(*session) for session in sessions]
+    with ThreadPoolExecutor(thread_name_prefix='gps-correct') as pool:
+        return list(pool.map(lambda session: PathCorrector().correct_batch(*session), sessions))
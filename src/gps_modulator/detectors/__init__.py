@@ -3,6 +3,6 @@
 This module contains various algorithms for detecting GPS spoofing attacks.
 """
 
-from .velocity_anomaly_detector import VelocityAnomalyDetector
+from .velocity_anomaly_detector import VelocityAnomalyDetector, DetectResult
 
-__all__ = ["VelocityAnomalyDetector"]
\ No newline at end of file
+__all__ = ["VelocityAnomalyDetector", "DetectResult"]
\ No newline at end of file
@@ -1,7 +1,37 @@
 """Velocity-based GPS spoofing detection."""
 
-from typing import Dict, Any, Optional
-from ..utils.gps_math import compute_velocity
+from typing import Dict, Any, Mapping, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from ..types import GPSPoint, GpsTrack
+from ..utils.gps_math import (
+    great_circle_approx, velocity_exceeds, velocity_exceeds_batch,
+    _parse_time_interval, _point_fields
+)
+
+
+class DetectResult(NamedTuple):
+    """
+    Outcome of one detection step, with the quantities behind it.
+    
+    Truthiness follows ``anomaly``, so it can stand in for the boolean
+    returned by ``detect``.
+    
+    Attributes:
+        anomaly (bool): Whether spoofing is detected
+        dt (float): Time since the previous point in seconds
+        distance (float): Distance from the previous point in meters
+        velocity (float): Implied velocity in m/s (0.0 if dt <= 0)
+    """
+    
+    anomaly: bool
+    dt: float
+    distance: float
+    velocity: float
+    
+    def __bool__(self) -> bool:
+        return self.anomaly
 
 
 class VelocityAnomalyDetector:
@@ -17,6 +47,8 @@ class VelocityAnomalyDetector:
         previous_point (Optional[Dict[str, Any]]): Last valid GPS point
     """
     
+    __slots__ = ('threshold_velocity', 'previous_point')
+    
     def __init__(self, threshold_velocity: float = 30.0) -> None:
         """
         Initialize the velocity anomaly detector.
@@ -44,11 +76,95 @@ class VelocityAnomalyDetector:
             self.previous_point = current_point
             return False
         
-        velocity = compute_velocity(self.previous_point, current_point)
+        is_spoofed = velocity_exceeds(self.previous_point, current_point,
+                                      self.threshold_velocity)
+        self.previous_point = current_point
+        
+        return is_spoofed
+    
+    def detect_details(self, current_point: Dict[str, Any]) -> DetectResult:
+        """
+        Like ``detect``, but also return the time step, distance and velocity.
+        
+        Saves callers that need these values from recomputing them against
+        the previous point themselves.
+        
+        Args:
+            current_point: GPS point (see ``detect``)
+        
+        Returns:
+            DetectResult: Detection flag with dt, distance and velocity; all
+                zero for the first point
+        """
+        prev = self.previous_point
         self.previous_point = current_point
+        if prev is None:
+            return DetectResult(False, 0.0, 0.0, 0.0)
+        
+        prev_lat, prev_lon, prev_ts = _point_fields(prev)
+        curr_lat, curr_lon, curr_ts = _point_fields(current_point)
+        dt = _parse_time_interval(prev_ts, curr_ts)
+        distance = great_circle_approx(prev_lat, prev_lon, curr_lat, curr_lon)
+        velocity = distance / dt if dt > 0.0 else 0.0
+        return DetectResult(velocity > self.threshold_velocity, dt, distance, velocity)
+    
+    def detect_batch(self,
+                     points: Union[np.ndarray, GpsTrack, Sequence[Mapping[str, Any]]],
+                     precision: str = 'float64') -> np.ndarray:
+        """
+        Detect spoofing for a sequence of GPS points at once.
+        
+        Equivalent to calling ``detect`` on each point in order: every
+        point is compared with the one before it (the first with
+        ``previous_point``, if set), and ``previous_point`` is left at the
+        last point.
+        
+        Args:
+            points: GpsTrack, array of shape (N, 3) with (latitude,
+                longitude, timestamp) rows, structured array with
+                'latitude', 'longitude' and 'timestamp' fields, or a sequence
+                of GPS point dictionaries / GPSPoints; timestamps are Unix
+                seconds
+            precision: 'float64' (default) or 'float32' for the trigonometry;
+                float32 is accurate to a few mm/s and roughly halves the cost,
+                but a velocity within that margin of the threshold may be
+                classified differently from ``detect``
+        
+        Returns:
+            np.ndarray: Boolean mask of shape (N,), True where spoofing is detected
+        """
+        if not isinstance(points, (np.ndarray, GpsTrack)):
+            points = GpsTrack.from_points(points)
+        
+        if isinstance(points, GpsTrack):
+            lats, lons, ts = points.latitude, points.longitude, points.timestamp
+        elif points.dtype.names:
+            lats, lons, ts = points['latitude'], points['longitude'], points['timestamp']
+        else:
+            points = np.asarray(points, dtype=np.float64)
+            lats, lons, ts = points[:, 0], points[:, 1], points[:, 2]
+        
+        n = len(lats)
+        if n == 0:
+            return np.zeros(0, dtype=np.bool_)
+        
+        prev = self.previous_point
+        if prev is not None:
+            # Prepend the carried-over point so it pairs with the first row
+            prev_lat, prev_lon, prev_ts = _point_fields(prev)
+            lats = np.concatenate(([prev_lat], lats))
+            lons = np.concatenate(([prev_lon], lons))
+            ts = np.concatenate(([prev_ts], ts))
+        
+        exceeds = velocity_exceeds_batch(lats, lons, ts, self.threshold_velocity,
+                                         precision=precision)
+        
+        spoofed = np.zeros(n, dtype=np.bool_)
+        spoofed[n - len(exceeds):] = exceeds
         
-        return velocity > self.threshold_velocity
+        self.previous_point = GPSPoint(float(lats[-1]), float(lons[-1]), float(ts[-1]))
+        return spoofed
     
     def reset(self) -> None:
         """Reset the detector's state."""
-        self.previous_point = None
\ No newline at end of file
+        self.previous_point = None
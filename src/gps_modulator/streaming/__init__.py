@@ -5,6 +5,21 @@ Provides utilities for streaming GPS data from various sources.
 
 from .gps_reader import GpsReader
 from .data_generators import MockGpsGenerator
-from .imu_streamer import EnhancedGpsReader, IMUStreamer
+from .imu_streamer import (
+    EnhancedGpsReader, IMUStreamer, IMU_RAW_DTYPE, pack_imu_frames, unpack_imu_frames
+)
+from .timestamp_batcher import TimestampBatcher, TimestampBlock, encode_timestamps, decode_timestamps
 
-__all__ = ["GpsReader", "MockGpsGenerator", "EnhancedGpsReader", "IMUStreamer"]
\ No newline at end of file
+__all__ = [
+    "GpsReader",
+    "MockGpsGenerator",
+    "EnhancedGpsReader",
+    "IMUStreamer",
+    "IMU_RAW_DTYPE",
+    "pack_imu_frames",
+    "unpack_imu_frames",
+    "TimestampBatcher",
+    "TimestampBlock",
+    "encode_timestamps",
+    "decode_timestamps"
+]
\ No newline at end of file
@@ -1,9 +1,27 @@
 """GPS data generators for testing and demonstration purposes."""
 
+import math
 import time
 import random
 from typing import Dict, Any, Iterator
 
+import numpy as np
+
+from ..types import GPSPoint
+from ..utils._jit import njit, FASTMATH
+from ..utils.gps_math import EARTH_RADIUS, _DEG2RAD, _RAD2DEG
+
+# Nominal seconds between points yielded by MockGpsGenerator.generate
+_STREAM_INTERVAL = 0.1
+
+# Record layout returned by MockGpsGenerator.generate_batch
+GPS_BATCH_DTYPE = np.dtype([
+    ('latitude', np.float64),
+    ('longitude', np.float64),
+    ('timestamp', np.float64),
+    ('is_spoofed', np.bool_),
+])
+
 
 class MockGpsGenerator:
     """
@@ -36,18 +54,20 @@ class MockGpsGenerator:
         self.spoof_magnitude = spoof_magnitude
         self.timestamp = time.time()
         self.point_count = 0
+        self._last_emit = None
     
-    def generate(self) -> Iterator[Dict[str, Any]]:
+    def generate(self) -> Iterator[GPSPoint]:
         """
         Generate continuous GPS data stream.
         
         Yields:
-            Dict[str, Any]: GPS data point with:
+            GPSPoint: GPS data point with:
                 - 'latitude': Current latitude
                 - 'longitude': Current longitude
                 - 'timestamp': Unix timestamp
                 - 'is_spoofed': Boolean indicating if point is spoofed
         """
+        next_tick = time.monotonic()
         while True:
             self.point_count += 1
             
@@ -56,17 +76,80 @@ class MockGpsGenerator:
             
             yield next_point
             
-            # Simulate real-time delay
-            time.sleep(0.1)
+            # Simulate real-time delay against a fixed schedule so the
+            # time spent by the consumer does not accumulate as drift
+            next_tick += _STREAM_INTERVAL
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+    
+    def generate_batch(self, n: int, interval: float = 1.0) -> np.ndarray:
+        """
+        Generate ``n`` GPS points at once without real-time delays.
+        
+        The walk is vectorized: bearings, spoof offsets and the spoof mask
+        are drawn in one call each, walk and spoof steps are selected with
+        the mask, and positions are accumulated with a cumulative sum of
+        per-step offsets in a local-tangent (flat earth) approximation, which
+        is accurate for the few-meter steps the generator produces.
+        
+        Args:
+            n: Number of points to generate
+            interval: Seconds between consecutive timestamps (default: 1.0)
+        
+        Returns:
+            np.ndarray: Structured array with GPS_BATCH_DTYPE fields
+                'latitude', 'longitude', 'timestamp' and 'is_spoofed'
+        """
+        batch = np.empty(n, dtype=GPS_BATCH_DTYPE)
+        if n <= 0:
+            return batch
+        
+        bearings = np.random.uniform(0.0, 360.0, n) * _DEG2RAD
+        spoofs = np.random.random(n) < self.spoof_rate
+        
+        # Normal movement: angular step split into north/east components
+        d_ang = self.velocity_mps * interval / EARTH_RADIUS
+        cos_lat = math.cos(self.current_lat * _DEG2RAD)
+        walk_dlat = np.cos(bearings)
+        walk_dlat *= d_ang * _RAD2DEG
+        walk_dlon = np.sin(bearings)
+        walk_dlon *= d_ang * _RAD2DEG / cos_lat
+        
+        # Spoofed points jump by a random offset instead; both deltas are
+        # computed for every point and blended with the mask (no branching)
+        mag = self.spoof_magnitude
+        spoof_dlat = np.random.uniform(-mag, mag, n)
+        spoof_dlon = np.random.uniform(-mag, mag, n)
+        dlat = np.where(spoofs, spoof_dlat, walk_dlat)
+        dlon = np.where(spoofs, spoof_dlon, walk_dlon)
+        
+        np.cumsum(dlat, out=batch['latitude'])
+        np.cumsum(dlon, out=batch['longitude'])
+        batch['latitude'] += self.current_lat
+        batch['longitude'] += self.current_lon
+        batch['timestamp'] = self.timestamp + interval * np.arange(1, n + 1)
+        batch['is_spoofed'] = spoofs
+        
+        last = batch[-1]
+        self.current_lat = float(last['latitude'])
+        self.current_lon = float(last['longitude'])
+        self.timestamp = float(last['timestamp'])
+        self.point_count += n
+        
+        return batch
     
-    def _generate_next_point(self) -> Dict[str, Any]:
+    def _generate_next_point(self) -> GPSPoint:
         """Generate the next GPS point in sequence."""
         is_spoofed = random.random() < self.spoof_rate
+        now = time.time()
         
         if not is_spoofed:
-            # Normal movement
+            # Normal movement at velocity_mps over the time since the last
+            # point, so the implied speed matches whatever the stream rate is;
+            # the first point takes one nominal step rather than jumping by
+            # however long the caller waited before iterating
             bearing = random.uniform(0, 360)
-            distance_m = self.velocity_mps * 1.0  # 1 second intervals
+            elapsed = _STREAM_INTERVAL if self._last_emit is None else now - self._last_emit
+            distance_m = self.velocity_mps * elapsed
             
             # Calculate new position
             new_lat, new_lon = self._calculate_new_position(
@@ -87,14 +170,10 @@ class MockGpsGenerator:
             self.current_lat = spoof_lat
             self.current_lon = spoof_lon
         
-        self.timestamp = time.time()
+        self.timestamp = now
+        self._last_emit = now
         
-        return {
-            'latitude': self.current_lat,
-            'longitude': self.current_lon,
-            'timestamp': self.timestamp,
-            'is_spoofed': is_spoofed
-        }
+        return GPSPoint(self.current_lat, self.current_lon, self.timestamp, is_spoofed)
     
     def _calculate_new_position(self, lat: float, lon: float, 
                                bearing_deg: float, distance_m: float) -> tuple[float, float]:
@@ -110,44 +189,43 @@ class MockGpsGenerator:
         Returns:
             tuple[float, float]: New (latitude, longitude) in degrees
         """
-        # Convert to radians
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
-        bearing_rad = math.radians(bearing_deg)
-        
-        # Earth's radius in meters
-        R = 6371000.0
-        
-        # Calculate new position
-        angular_distance = distance_m / R
-        
-        new_lat_rad = math.asin(
-            math.sin(lat_rad) * math.cos(angular_distance) +
-            math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
-        )
-        
-        new_lon_rad = lon_rad + math.atan2(
-            math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
-            math.cos(angular_distance) - math.sin(lat_rad) * math.sin(new_lat_rad)
-        )
-        
-        # Convert back to degrees
-        new_lat = math.degrees(new_lat_rad)
-        new_lon = math.degrees(new_lon_rad)
-        
-        return new_lat, new_lon
+        return _new_position(lat, lon, bearing_deg, distance_m)
 
 
-def gps_data_src_mock() -> Iterator[Dict[str, Any]]:
+@njit(cache=True, fastmath=FASTMATH)
+def _new_position(lat, lon, bearing_deg, distance_m, R=EARTH_RADIUS):
+    """Destination-point kernel, JIT-compiled when Numba is available."""
+    # Convert to radians
+    lat_rad = lat * _DEG2RAD
+    lon_rad = lon * _DEG2RAD
+    bearing_rad = bearing_deg * _DEG2RAD
+    
+    # Calculate new position
+    angular_distance = distance_m / R
+    
+    new_lat_rad = math.asin(
+        math.sin(lat_rad) * math.cos(angular_distance) +
+        math.cos(lat_rad) * math.sin(angular_distance) * math.cos(bearing_rad)
+    )
+    
+    new_lon_rad = lon_rad + math.atan2(
+        math.sin(bearing_rad) * math.sin(angular_distance) * math.cos(lat_rad),
+        math.cos(angular_distance) - math.sin(lat_rad) * math.sin(new_lat_rad)
+    )
+    
+    # Convert back to degrees
+    new_lat = new_lat_rad * _RAD2DEG
+    new_lon = new_lon_rad * _RAD2DEG
+    
+    return new_lat, new_lon
+
+
+def gps_data_src_mock() -> Iterator[GPSPoint]:
     """
     Legacy compatibility function for mock GPS data.
     
     Returns:
-        Iterator[Dict[str, Any]]: Mock GPS data stream
+        Iterator[GPSPoint]: Mock GPS data stream
     """
     generator = MockGpsGenerator()
     return generator.generate()
-
-
-# Import math for calculations
-import math
\ No newline at end of file
@@ -1,6 +1,9 @@
 """GPS data reader for streaming GPS coordinates."""
 
-from typing import Dict, Any, Callable, Iterator, Optional
+from typing import Dict, Any, Callable, Iterator, Optional, Union
+
+from ..types import GPSPoint
+from ..utils.gps_math import validate_coordinates, _point_latlon
 
 
 class GpsReader:
@@ -24,18 +27,25 @@ class GpsReader:
         """
         self.data_source = data_source
     
-    def stream(self) -> Iterator[Dict[str, Any]]:
+    def stream(self) -> Iterator[Union[GPSPoint, Dict[str, Any]]]:
         """
         Stream valid GPS data from the data source.
         
+        GPSPoint inputs are passed through unchanged after a range check;
+        dictionaries are validated and normalized.
+        
         Yields:
-            Dict[str, Any]: Validated GPS data dictionary with:
+            Union[GPSPoint, Dict[str, Any]]: Validated GPS data with:
                 - 'latitude' (float): Latitude in decimal degrees
                 - 'longitude' (float): Longitude in decimal degrees
                 - 'timestamp' (float): Unix timestamp
         """
         for gps_data in self.data_source():
-            if self._is_valid(gps_data):
+            # Typed points need no key lookup or conversion
+            if type(gps_data) is GPSPoint:
+                if validate_coordinates(gps_data.latitude, gps_data.longitude):
+                    yield gps_data
+            elif self._is_valid(gps_data):
                 yield self._normalize_data(gps_data)
     
     def _is_valid(self, gps_data: Dict[str, Any]) -> bool:
@@ -62,8 +72,7 @@ class GpsReader:
                         return False
             
             # Validate data types and ranges
-            lat = float(gps_data.get('latitude', gps_data.get('lat', 0.0)))
-            lon = float(gps_data.get('longitude', gps_data.get('lon', 0.0)))
+            lat, lon = _point_latlon(gps_data)
             
             # Check coordinate ranges
             if not (-90 <= lat <= 90):
@@ -93,8 +102,9 @@ class GpsReader:
         Returns:
             Dict[str, Any]: Normalized GPS data
         """
+        lat, lon = _point_latlon(gps_data)
         return {
-            'latitude': float(gps_data.get('latitude', gps_data.get('lat', 0.0))),
-            'longitude': float(gps_data.get('longitude', gps_data.get('lon', 0.0))),
+            'latitude': lat,
+            'longitude': lon,
             'timestamp': float(gps_data.get('timestamp', gps_data.get('ts', 0.0)))
         }
\ No newline at end of file
@@ -4,8 +4,72 @@ import time
 import random
 import math
 from typing import Dict, Any, Iterator, Optional
+
+import numpy as np
+
 from ..correction.imu_handler import MockIMUGenerator, EnhancedIMUHandler
 
+# Packed raw IMU frame: int16 sensor counts plus a float64 timestamp
+# (26 bytes per sample instead of nine 8-byte floats)
+IMU_RAW_DTYPE = np.dtype([
+    ('accel', '<i2', (3,)),
+    ('gyro', '<i2', (3,)),
+    ('mag', '<i2', (3,)),
+    ('timestamp', '<f8'),
+])
+
+# Physical units per count for full-scale ranges of ±16 g, ±2000 °/s and ±100 µT
+ACCEL_SCALE = 16 * 9.80665 / 32768
+GYRO_SCALE = 2000.0 / 32768
+MAG_SCALE = 100.0 / 32768
+
+_RAW_GROUPS = (
+    ('accel', ('accel_x', 'accel_y', 'accel_z'), ACCEL_SCALE),
+    ('gyro', ('gyro_x', 'gyro_y', 'gyro_z'), GYRO_SCALE),
+    ('mag', ('mag_x', 'mag_y', 'mag_z'), MAG_SCALE),
+)
+
+
+def pack_imu_frames(batch: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Quantize per-channel IMU arrays into packed raw frames.
+    
+    Args:
+        batch: Arrays per channel as returned by ``IMUStreamer.get_imu_batch``
+    
+    Returns:
+        np.ndarray: Array of dtype IMU_RAW_DTYPE; readings outside the
+            full-scale range are clipped
+    """
+    frames = np.empty(len(batch['timestamp']), dtype=IMU_RAW_DTYPE)
+    for group, channels, scale in _RAW_GROUPS:
+        counts = np.column_stack([batch[name] for name in channels]) / scale
+        np.rint(counts, out=counts)
+        np.clip(counts, -32768, 32767, out=counts)
+        frames[group] = counts
+    frames['timestamp'] = batch['timestamp']
+    return frames
+
+
+def unpack_imu_frames(frames: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Convert packed raw frames back to per-channel arrays in physical units.
+    
+    Args:
+        frames: Array of dtype IMU_RAW_DTYPE
+    
+    Returns:
+        Dict[str, np.ndarray]: float32 arrays for each sensor channel and
+            a float64 'timestamp' array
+    """
+    batch = {}
+    for group, channels, scale in _RAW_GROUPS:
+        values = frames[group] * np.float32(scale)
+        for i, name in enumerate(channels):
+            batch[name] = values[:, i]
+    batch['timestamp'] = frames['timestamp'].copy()
+    return batch
+
 
 class IMUStreamer:
     """Real-time IMU data streaming for GPS integration."""
@@ -22,6 +86,7 @@ class IMUStreamer:
         self.mock_generator = MockIMUGenerator()
         self.last_heading = 0.0
         self.last_timestamp = 0.0
+        self._batch: Optional[Dict[str, np.ndarray]] = None
     
     def stream_imu_data(self) -> Iterator[Dict[str, float]]:
         """
@@ -53,11 +118,59 @@ class IMUStreamer:
         timestamp = time.time()
         heading_change = random.uniform(-2.0, 2.0)
         return self.mock_generator.generate_data(timestamp, heading_change)
+    
+    def get_imu_batch(self, n: int = 16) -> Dict[str, np.ndarray]:
+        """
+        Get a block of IMU samples as one array per channel.
+        
+        Samples are spaced by the update interval. A block continues one
+        interval after the last sample of the previous block, so back-to-back
+        calls never overlap; the first block, or one requested after a pause
+        longer than the block, ends at the current time instead.
+        
+        The arrays are allocated once per block size and refilled on every
+        call, so copy them if they need to outlive the next call.
+        
+        Args:
+            n: Number of samples per block (default: 16)
+        
+        Returns:
+            Dict[str, np.ndarray]: float32 arrays for each sensor channel and
+                a float64 'timestamp' array, each of length n
+        """
+        if self._batch is not None and len(self._batch['timestamp']) != n:
+            self._batch = None
+        
+        now = time.time()
+        start = now - self.update_interval * (n - 1)
+        if self.last_timestamp > 0:
+            start = max(start, self.last_timestamp + self.update_interval)
+        timestamps = start + self.update_interval * np.arange(n)
+        if n:
+            self.last_timestamp = float(timestamps[-1])
+        heading_changes = np.random.uniform(-2.0, 2.0, n)
+        
+        self._batch = self.mock_generator.generate_batch(timestamps, heading_changes, out=self._batch)
+        return self._batch
+    
+    def get_imu_frames(self, n: int = 16) -> np.ndarray:
+        """
+        Get a block of IMU samples as packed int16 raw frames.
+        
+        Args:
+            n: Number of samples per block (default: 16)
+        
+        Returns:
+            np.ndarray: Array of dtype IMU_RAW_DTYPE (see ``unpack_imu_frames``)
+        """
+        return pack_imu_frames(self.get_imu_batch(n))
 
 
 class EnhancedGpsReader:
     """Enhanced GPS reader that integrates GPS and IMU data."""
     
+    __slots__ = ('use_imu', 'imu_streamer', 'imu_handler')
+    
     def __init__(self, use_imu: bool = True, imu_rate: float = 10.0) -> None:
         """
         Initialize enhanced GPS reader.
@@ -80,7 +193,7 @@ class EnhancedGpsReader:
         Returns:
             Dict[str, Any]: Enhanced data with IMU integration
         """
-        enhanced_data = gps_data.copy()
+        enhanced_data = dict(gps_data)
         
         if self.use_imu and self.imu_streamer:
             # Get current IMU data
@@ -142,18 +255,26 @@ class MockIMUDataGenerator:
         dt = 0.1  # 10Hz update rate
         steps = int(duration / dt)
         
+        # Profile breakpoints as arrays, built once rather than every step
+        if speed_profile:
+            speed_times = np.fromiter((p[0] for p in speed_profile), np.float64, len(speed_profile))
+            speed_values = np.fromiter((p[1] for p in speed_profile), np.float64, len(speed_profile))
+        if heading_changes:
+            heading_times = np.fromiter((h[0] for h in heading_changes), np.float64, len(heading_changes))
+            heading_values = np.fromiter((h[1] for h in heading_changes), np.float64, len(heading_changes))
+        
         for step in range(steps):
             current_time = step * dt
             
             # Update speed based on profile
             if speed_profile:
-                speed = np.interp(current_time, [p[0] for p in speed_profile], [p[1] for p in speed_profile])
+                speed = np.interp(current_time, speed_times, speed_values)
             else:
                 speed = self.velocity + random.uniform(-1.0, 1.0)
             
             # Update heading based on changes
             if heading_changes:
-                heading_change = np.interp(current_time, [h[0] for h in heading_changes], [h[1] for h in heading_changes])
+                heading_change = np.interp(current_time, heading_times, heading_values)
             else:
                 heading_change = random.uniform(-2.0, 2.0)
             
@@ -1,10 +1,11 @@
+import asyncio
 import time
 import logging
 import os
 import math
 import random
 import csv
-from typing import Dict, Any, Iterator, Optional
+from typing import Dict, Any, AsyncIterator, Iterator, Optional, Union
 from abc import ABC, abstractmethod
 
 # Optional dependencies - only import when needed
@@ -26,6 +27,23 @@ try:
 except ImportError:
     HTTP_AVAILABLE = False
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import serial_asyncio
+    SERIAL_ASYNC_AVAILABLE = True
+except ImportError:
+    SERIAL_ASYNC_AVAILABLE = False
+
+# NMEA sentence types carrying a position fix. Matched after the two-letter
+# talker ID so multi-constellation receivers ($GN, $GL, $GA, $BD, ...) are
+# handled the same way as plain GPS ($GP).
+_POSITION_SENTENCES = frozenset(('GGA', 'RMC'))
+
 
 class RealTimeSource(ABC):
     """Abstract base class for real-time GPS data sources."""
@@ -44,6 +62,23 @@ class RealTimeSource(ABC):
     def stop(self) -> None:
         """Stop the GPS source."""
         pass
+    
+    async def stream_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream GPS data points without blocking the event loop.
+        
+        The default implementation drives the blocking ``stream()`` generator
+        from the default executor. Sources with a native asyncio transport
+        override this.
+        """
+        loop = asyncio.get_running_loop()
+        iterator = self.stream()
+        sentinel = object()
+        while True:
+            point = await loop.run_in_executor(None, next, iterator, sentinel)
+            if point is sentinel:
+                return
+            yield point
 
 
 class SerialGPSSource(RealTimeSource):
@@ -90,20 +125,53 @@ class SerialGPSSource(RealTimeSource):
         while True:
             try:
                 line = self.serial_connection.readline().decode('ascii', errors='ignore').strip()
-                if line.startswith('$GPGGA') or line.startswith('$GPRMC'):
-                    msg = pynmea2.parse(line)
-                    if msg.latitude and msg.longitude:
-                        yield {
-                            'latitude': float(msg.latitude),
-                            'longitude': float(msg.longitude),
-                            'timestamp': time.time(),
-                            'speed': float(msg.spd_over_grnd) if hasattr(msg, 'spd_over_grnd') else 0.0,
-                            'altitude': float(msg.altitude) if hasattr(msg, 'altitude') else 0.0
-                        }
+                point = self._parse_line(line)
+                if point is not None:
+                    yield point
             except Exception as e:
                 self.logger.warning(f"GPS parsing error: {e}")
                 time.sleep(1)
     
+    async def stream_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream GPS data from the serial port using pyserial-asyncio."""
+        if not SERIAL_ASYNC_AVAILABLE:
+            raise ImportError("pyserial-asyncio is required. Install with: pip install pyserial-asyncio")
+        
+        reader, writer = await serial_asyncio.open_serial_connection(
+            url=self.port, baudrate=self.baud_rate
+        )
+        self.logger.info(f"GPS connected to {self.port} at {self.baud_rate} baud (async)")
+        
+        try:
+            while True:
+                try:
+                    raw = await reader.readline()
+                    point = self._parse_line(raw.decode('ascii', errors='ignore').strip())
+                    if point is not None:
+                        yield point
+                except Exception as e:
+                    self.logger.warning(f"GPS parsing error: {e}")
+                    await asyncio.sleep(1)
+        finally:
+            writer.close()
+    
+    def _parse_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """Parse an NMEA line into a GPS point, or None if it carries no fix."""
+        if line[:1] != '$' or line[3:6] not in _POSITION_SENTENCES:
+            return None
+        
+        msg = pynmea2.parse(line)
+        if not (msg.latitude and msg.longitude):
+            return None
+        
+        return {
+            'latitude': float(msg.latitude),
+            'longitude': float(msg.longitude),
+            'timestamp': time.time(),
+            'speed': float(msg.spd_over_grnd) if hasattr(msg, 'spd_over_grnd') else 0.0,
+            'altitude': float(msg.altitude) if hasattr(msg, 'altitude') else 0.0
+        }
+    
     def stop(self) -> None:
         """Close the serial connection."""
         if self.serial_connection:
@@ -128,6 +196,7 @@ class HttpGPSSource(RealTimeSource):
         self.api_url = api_url
         self.update_interval = update_interval
         self.logger = logging.getLogger(__name__)
+        self._session = None
     
     def start(self) -> None:
         """Test the HTTP connection."""
@@ -146,18 +215,50 @@ class HttpGPSSource(RealTimeSource):
             try:
                 response = requests.get(self.api_url, timeout=2)
                 if response.status_code == 200:
-                    data = response.json()
-                    yield {
-                        'latitude': float(data['lat']),
-                        'longitude': float(data['lon']),
-                        'timestamp': float(data.get('timestamp', time.time())),
-                        'speed': float(data.get('speed', 0.0)),
-                        'accuracy': float(data.get('accuracy', 0.0))
-                    }
+                    yield self._parse_payload(response.json())
             except Exception as e:
                 self.logger.warning(f"HTTP GPS error: {e}")
             time.sleep(self.update_interval)
     
+    async def start_async(self) -> None:
+        """Open a keep-alive aiohttp session for async streaming."""
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required. Install with: pip install aiohttp")
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2))
+    
+    async def stream_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream GPS data from HTTP API over a shared aiohttp session."""
+        await self.start_async()
+        try:
+            while True:
+                try:
+                    async with self._session.get(self.api_url) as response:
+                        if response.status == 200:
+                            yield self._parse_payload(await response.json())
+                except Exception as e:
+                    self.logger.warning(f"HTTP GPS error: {e}")
+                await asyncio.sleep(self.update_interval)
+        finally:
+            # Runs on cancellation or aclose() so the session never leaks
+            await self.stop_async()
+    
+    async def stop_async(self) -> None:
+        """Close the aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _parse_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an API JSON payload into a GPS point."""
+        return {
+            'latitude': float(data['lat']),
+            'longitude': float(data['lon']),
+            'timestamp': float(data.get('timestamp', time.time())),
+            'speed': float(data.get('speed', 0.0)),
+            'accuracy': float(data.get('accuracy', 0.0))
+        }
+    
     def stop(self) -> None:
         """No cleanup needed for HTTP."""
         pass
@@ -249,33 +350,43 @@ class MockGpsGenerator(RealTimeSource):
     def stream(self) -> Iterator[Dict[str, Any]]:
         """Stream mock GPS data points."""
         while True:
-            # Simulate movement (simple linear progression for demonstration)
-            # 1 degree of latitude is approx 111,320 meters
-            # 1 degree of longitude is approx 111,320 * cos(latitude) meters
-            delta_lat = (self.velocity_mps * self.update_interval) / 111320.0
-            delta_lon = (self.velocity_mps * self.update_interval) / (111320.0 * abs(math.cos(math.radians(self.current_lat))))
-
-            self.current_lat += delta_lat
-            self.current_lon += delta_lon
-
-            # Simulate spoofing
-            is_spoofed = False
-            if random.random() < self.spoof_rate:
-                self.current_lat += random.uniform(-self.spoof_magnitude, self.spoof_magnitude)
-                self.current_lon += random.uniform(-self.spoof_magnitude, self.spoof_magnitude)
-                is_spoofed = True
+            yield self._next_point()
+            time.sleep(self.update_interval)
+
+    async def stream_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream mock GPS data points without blocking the event loop."""
+        while True:
+            yield self._next_point()
+            await asyncio.sleep(self.update_interval)
+
+    def _next_point(self) -> Dict[str, Any]:
+        """Advance the simulated position and return the next point."""
+        # Simulate movement (simple linear progression for demonstration)
+        # 1 degree of latitude is approx 111,320 meters
+        # 1 degree of longitude is approx 111,320 * cos(latitude) meters
+        delta_lat = (self.velocity_mps * self.update_interval) / 111320.0
+        delta_lon = (self.velocity_mps * self.update_interval) / (111320.0 * abs(math.cos(math.radians(self.current_lat))))
+
+        self.current_lat += delta_lat
+        self.current_lon += delta_lon
+
+        # Simulate spoofing
+        is_spoofed = False
+        if random.random() < self.spoof_rate:
+            self.current_lat += random.uniform(-self.spoof_magnitude, self.spoof_magnitude)
+            self.current_lon += random.uniform(-self.spoof_magnitude, self.spoof_magnitude)
+            is_spoofed = True
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug("Simulating spoofing event.")
 
-            point = {
-                'latitude': self.current_lat,
-                'longitude': self.current_lon,
-                'altitude': 100.0,  # Static altitude for mock data
-                'timestamp': time.time(),
-                'speed': self.velocity_mps,
-                'is_spoofed_simulated': is_spoofed # For internal mock data tracking
-            }
-            yield point
-            time.sleep(self.update_interval)
+        return {
+            'latitude': self.current_lat,
+            'longitude': self.current_lon,
+            'altitude': 100.0,  # Static altitude for mock data
+            'timestamp': time.time(),
+            'speed': self.velocity_mps,
+            'is_spoofed_simulated': is_spoofed # For internal mock data tracking
+        }
 
     def stop(self) -> None:
         """No specific stop action for mock generator."""
@@ -323,6 +434,59 @@ def create_gps_source(
         raise ValueError(f"Unknown source type: {source_type}")
 
 
+async def merge_streams(*sources: Union[RealTimeSource, AsyncIterator[Dict[str, Any]]]
+                        ) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Fan in several GPS/IMU streams on a single event loop.
+    
+    Each source is consumed by its own task and points are yielded in
+    arrival order. Finite sources simply drop out; the merged stream ends
+    once every source is exhausted. A source that fails is logged and
+    drops out as well, and the first such error is re-raised once the
+    remaining sources have been drained.
+    
+    Args:
+        sources: RealTimeSource instances (consumed via ``stream_async()``)
+            or any async iterators of data dictionaries
+    
+    Yields:
+        Dict[str, Any]: Data points from whichever source produced next
+    
+    Raises:
+        Exception: The first error raised by any source, after draining
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    errors = []
+    
+    async def pump(source) -> None:
+        stream = source.stream_async() if isinstance(source, RealTimeSource) else source
+        try:
+            async for point in stream:
+                await queue.put(point)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Stream source {source!r} failed: {e}")
+            errors.append(e)
+        finally:
+            await queue.put(done)
+    
+    tasks = [asyncio.ensure_future(pump(source)) for source in sources]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is done:
+                remaining -= 1
+            else:
+                yield item
+        if errors:
+            raise errors[0]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # Convenience functions for direct usage
 def get_serial_gps_source(port: str, baud: int = 9600):
     """Get serial GPS data source."""
@@ -0,0 +1,218 @@
+"""Compact timestamp encoding for batched GPS record emission."""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass
+class TimestampBlock:
+    """
+    Delta-encoded, bit-packed block of timestamps.
+    
+    Timestamps are stored as integer microseconds: the first value is kept
+    as an absolute base, the remaining values as deltas. Deltas are shifted
+    by their minimum (frame of reference) and packed at the smallest bit
+    width that holds the largest shifted delta.
+    
+    Attributes:
+        base_us (int): First timestamp in microseconds
+        delta_offset (int): Minimum delta subtracted before packing
+        bit_width (int): Bits used per packed delta
+        count (int): Number of timestamps in the block
+        payload (bytes): Packed delta bits
+    """
+    
+    base_us: int
+    delta_offset: int
+    bit_width: int
+    count: int
+    payload: bytes
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate encoded size in bytes (header plus payload)."""
+        return 8 + 8 + 1 + 4 + len(self.payload)
+    
+    def decode(self) -> np.ndarray:
+        """
+        Decode the block back into Unix timestamps.
+        
+        Returns:
+            np.ndarray: Timestamps in seconds (float64)
+        """
+        return decode_timestamps(self)
+
+
+def encode_timestamps(timestamps: Sequence[float]) -> TimestampBlock:
+    """
+    Encode Unix timestamps into a delta + bit-packed block.
+    
+    Args:
+        timestamps: Sequence of Unix timestamps in seconds
+    
+    Returns:
+        TimestampBlock: Encoded block with microsecond resolution
+    """
+    micros = np.rint(np.asarray(timestamps, dtype=np.float64) * 1e6).astype(np.int64)
+    count = int(micros.size)
+    
+    if count == 0:
+        return TimestampBlock(0, 0, 0, 0, b'')
+    
+    deltas = np.diff(micros)
+    if deltas.size == 0:
+        return TimestampBlock(int(micros[0]), 0, 0, 1, b'')
+    
+    delta_offset = int(deltas.min())
+    shifted = (deltas - delta_offset).astype(np.uint64)
+    bit_width = int(shifted.max()).bit_length()
+    
+    if bit_width == 0:
+        # Perfectly regular sampling: every delta equals the offset
+        return TimestampBlock(int(micros[0]), delta_offset, 0, count, b'')
+    
+    shifts = np.arange(bit_width - 1, -1, -1, dtype=np.uint64)
+    bits = ((shifted[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+    payload = np.packbits(bits.ravel()).tobytes()
+    
+    return TimestampBlock(int(micros[0]), delta_offset, bit_width, count, payload)
+
+
+def decode_timestamps(block: TimestampBlock) -> np.ndarray:
+    """
+    Decode a TimestampBlock into Unix timestamps.
+    
+    Args:
+        block: Encoded timestamp block
+    
+    Returns:
+        np.ndarray: Timestamps in seconds (float64)
+    """
+    if block.count == 0:
+        return np.empty(0, dtype=np.float64)
+    
+    n_deltas = block.count - 1
+    if block.bit_width == 0:
+        shifted = np.zeros(n_deltas, dtype=np.int64)
+    else:
+        bits = np.unpackbits(np.frombuffer(block.payload, dtype=np.uint8))
+        bits = bits[:n_deltas * block.bit_width].reshape(n_deltas, block.bit_width)
+        weights = np.uint64(1) << np.arange(block.bit_width - 1, -1, -1, dtype=np.uint64)
+        shifted = (bits.astype(np.uint64) * weights).sum(axis=1).astype(np.int64)
+    
+    micros = np.empty(block.count, dtype=np.int64)
+    micros[0] = block.base_us
+    np.cumsum(shifted + block.delta_offset, out=micros[1:])
+    micros[1:] += block.base_us
+    
+    return micros / 1e6
+
+
+class TimestampBatcher:
+    """
+    Buffers GPS records and emits them in batches with compact timestamps.
+    
+    Records are accumulated until either ``batch_size`` records are buffered
+    or ``flush_interval`` seconds have elapsed since the first buffered
+    record. On flush, timestamps are stripped from the records and encoded
+    into a single TimestampBlock.
+    
+    The batcher has no timer of its own: the interval is only checked when
+    a record is added or ``flush_if_due`` is called, so a stream that goes
+    quiet must poll ``flush_if_due`` (or call ``flush``) to emit its tail.
+    
+    Attributes:
+        batch_size (int): Maximum records per batch
+        flush_interval (float): Maximum buffering time in seconds
+        sink (Optional[Callable]): Called with each flushed batch
+    """
+    
+    def __init__(self,
+                 batch_size: int = 1000,
+                 flush_interval: float = 0.5,
+                 sink: Optional[Callable[[TimestampBlock, List[Dict[str, Any]]], None]] = None) -> None:
+        """
+        Initialize the timestamp batcher.
+        
+        Args:
+            batch_size: Maximum number of records per batch (default: 1000)
+            flush_interval: Maximum time in seconds to buffer records (default: 0.5)
+            sink: Optional callable receiving ``(block, records)`` on flush
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.sink = sink
+        self._records: List[Dict[str, Any]] = []
+        # At most batch_size timestamps are buffered, so allocate them once
+        self._timestamps = np.empty(batch_size, dtype=np.float64)
+        self._first_buffered: Optional[float] = None
+    
+    def add(self, record: Dict[str, Any]) -> Optional[Tuple[TimestampBlock, List[Dict[str, Any]]]]:
+        """
+        Add a record to the current batch.
+        
+        Args:
+            record: GPS record dictionary containing a 'timestamp' key
+        
+        Returns:
+            Optional[Tuple[TimestampBlock, List[Dict[str, Any]]]]: The flushed
+            batch if this record triggered a flush, None otherwise
+        """
+        now = time.monotonic()
+        if self._first_buffered is None:
+            self._first_buffered = now
+        
+        self._timestamps[len(self._records)] = record['timestamp']
+        self._records.append({k: v for k, v in record.items() if k != 'timestamp'})
+        
+        if (len(self._records) >= self.batch_size or
+                now - self._first_buffered >= self.flush_interval):
+            return self.flush()
+        return None
+    
+    def flush_if_due(self) -> Optional[Tuple[TimestampBlock, List[Dict[str, Any]]]]:
+        """
+        Flush the buffered records if ``flush_interval`` has elapsed.
+        
+        Call this periodically (e.g. from an event-loop timer) when records
+        may stop arriving, since ``add`` only checks the interval on arrival.
+        
+        Returns:
+            Optional[Tuple[TimestampBlock, List[Dict[str, Any]]]]: The flushed
+            batch if it was due, None otherwise
+        """
+        if (self._first_buffered is not None and
+                time.monotonic() - self._first_buffered >= self.flush_interval):
+            return self.flush()
+        return None
+    
+    def flush(self) -> Optional[Tuple[TimestampBlock, List[Dict[str, Any]]]]:
+        """
+        Encode and emit the buffered records.
+        
+        Returns:
+            Optional[Tuple[TimestampBlock, List[Dict[str, Any]]]]: The encoded
+            timestamp block and the timestamp-free records, or None if empty
+        """
+        if not self._records:
+            return None
+        
+        # Encoding copies the timestamps, so the buffer is reused
+        batch = (encode_timestamps(self._timestamps[:len(self._records)]), self._records)
+        
+        self._records = []
+        self._first_buffered = None
+        
+        if self.sink is not None:
+            self.sink(*batch)
+        return batch
+    
+    def __len__(self) -> int:
+        """Number of records currently buffered."""
+        return len(self._records)
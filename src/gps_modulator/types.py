@@ -0,0 +1,183 @@
+"""Lightweight record types shared across the package."""
+
+import sys
+from collections import abc
+from dataclasses import dataclass, asdict
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, Iterator, Mapping, Sequence, Tuple
+
+import numpy as np
+
+# __slots__ through dataclass() needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+_FIELDS = ('latitude', 'longitude', 'timestamp', 'is_spoofed')
+
+# Field getters per point layout, picked once per track from its first point
+_POINT_GETTERS = attrgetter('latitude'), attrgetter('longitude'), attrgetter('timestamp')
+_KEY_GETTERS = itemgetter('latitude'), itemgetter('longitude'), itemgetter('timestamp')
+_ALIAS_GETTERS = itemgetter('lat'), itemgetter('lon'), itemgetter('timestamp')
+
+
+@dataclass(frozen=True, **_SLOTS)
+class GPSPoint:
+    """
+    Immutable GPS fix.
+    
+    Implements the read-only ``collections.abc.Mapping`` interface
+    (``point['latitude']``, ``point.get('timestamp')``, ``point.items()``,
+    ``dict(point)``) so it can be passed to code written for the GPS point
+    dictionaries used elsewhere in the package.
+    
+    Attributes:
+        latitude (float): Latitude in decimal degrees
+        longitude (float): Longitude in decimal degrees
+        timestamp (float): Unix timestamp
+        is_spoofed (bool): Whether the point is known to be spoofed
+    """
+    
+    latitude: float
+    longitude: float
+    timestamp: float
+    is_spoofed: bool = False
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELDS
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(_FIELDS)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field ``key``, or ``default`` if there is no such field."""
+        if key not in _FIELDS:
+            return default
+        return getattr(self, key)
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Field names, in declaration order."""
+        return _FIELDS
+    
+    def values(self) -> Tuple[Any, ...]:
+        """Field values, in declaration order."""
+        return (self.latitude, self.longitude, self.timestamp, self.is_spoofed)
+    
+    def items(self) -> Tuple[Tuple[str, Any], ...]:
+        """(name, value) pairs, in declaration order."""
+        return tuple(zip(_FIELDS, self.values()))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the point as a plain dictionary."""
+        return asdict(self)
+    
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> 'GPSPoint':
+        """
+        Build a point from a GPS dictionary.
+        
+        Args:
+            data: Mapping with 'latitude'/'lat', 'longitude'/'lon' and
+                'timestamp'/'ts' keys, and optionally 'is_spoofed'
+        
+        Returns:
+            GPSPoint: The converted point
+        """
+        # Canonical keys first; the aliases are only looked up when missing
+        try:
+            lat, lon = data['latitude'], data['longitude']
+        except KeyError:
+            lat = data.get('latitude', data.get('lat', 0.0))
+            lon = data.get('longitude', data.get('lon', 0.0))
+        return cls(
+            float(lat),
+            float(lon),
+            float(data.get('timestamp', data.get('ts', 0.0))),
+            bool(data.get('is_spoofed', False))
+        )
+
+
+abc.Mapping.register(GPSPoint)
+
+
+@dataclass(frozen=True, eq=False, **_SLOTS)
+class GpsTrack:
+    """
+    Sequence of GPS fixes stored as one array per field.
+    
+    The column layout lets batch code (e.g.
+    ``VelocityAnomalyDetector.detect_batch``) work on contiguous float64
+    arrays without touching per-point dictionaries.
+    
+    Attributes:
+        latitude (np.ndarray): Latitudes in decimal degrees
+        longitude (np.ndarray): Longitudes in decimal degrees
+        timestamp (np.ndarray): Unix timestamps in seconds
+    """
+    
+    latitude: np.ndarray
+    longitude: np.ndarray
+    timestamp: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    def __getitem__(self, index: int) -> GPSPoint:
+        return GPSPoint(float(self.latitude[index]),
+                        float(self.longitude[index]),
+                        float(self.timestamp[index]))
+    
+    @classmethod
+    def from_points(cls,
+                    points: Sequence[Mapping[str, Any]],
+                    drop_invalid: bool = False) -> 'GpsTrack':
+        """
+        Build a track from GPS point dictionaries or GPSPoints.
+        
+        Args:
+            points: Mappings with 'latitude'/'lat', 'longitude'/'lon' and
+                'timestamp' keys
+            drop_invalid: Remove points with out-of-range or NaN
+                coordinates, validated in one vectorized pass (default: False)
+        
+        Returns:
+            GpsTrack: The points as float64 columns
+        """
+        n = len(points)
+        try:
+            # Points in a track normally share one layout, so choose the
+            # getters from the first point and map them in C
+            first = points[0] if n else None
+            if type(first) is GPSPoint:
+                getters = _POINT_GETTERS
+            elif n and 'latitude' not in first and 'lat' in first:
+                getters = _ALIAS_GETTERS
+            else:
+                getters = _KEY_GETTERS
+            track = cls(*(np.fromiter(map(get, points), np.float64, n) for get in getters))
+        except (KeyError, AttributeError):
+            # Mixed layouts
+            track = cls(
+                np.fromiter((p.get('latitude', p.get('lat', 0.0)) for p in points), np.float64, n),
+                np.fromiter((p.get('longitude', p.get('lon', 0.0)) for p in points), np.float64, n),
+                np.fromiter((p['timestamp'] for p in points), np.float64, n)
+            )
+        if drop_invalid:
+            from .utils.gps_math import validate_coordinates_batch
+            valid = validate_coordinates_batch(track.latitude, track.longitude)
+            if not valid.all():
+                track = cls(track.latitude[valid], track.longitude[valid], track.timestamp[valid])
+        return track
+    
+    def points(self) -> Iterable[GPSPoint]:
+        """Iterate over the fixes as GPSPoints."""
+        for lat, lon, ts in zip(self.latitude.tolist(),
+                                self.longitude.tolist(),
+                                self.timestamp.tolist()):
+            yield GPSPoint(lat, lon, ts)
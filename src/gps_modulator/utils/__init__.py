@@ -1,5 +1,27 @@
 """Utility functions and helpers for GPS spoofing detection."""
 
-from .gps_math import compute_velocity, haversine_distance, validate_coordinates, bearing
+from .gps_math import (
+    compute_velocity,
+    compute_velocity_batch,
+    velocity_exceeds,
+    velocity_exceeds_batch,
+    haversine_distance,
+    haversine_distance_batch,
+    great_circle_approx,
+    validate_coordinates,
+    validate_coordinates_batch,
+    bearing
+)
 
-__all__ = ["compute_velocity", "haversine_distance", "validate_coordinates", "bearing"]
\ No newline at end of file
+__all__ = [
+    "compute_velocity",
+    "compute_velocity_batch",
+    "velocity_exceeds",
+    "velocity_exceeds_batch",
+    "haversine_distance",
+    "haversine_distance_batch",
+    "great_circle_approx",
+    "validate_coordinates",
+    "validate_coordinates_batch",
+    "bearing"
+]
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""Optional Numba JIT compilation for numeric kernels."""
+
+from typing import Any, Callable
+
+# Optional dependency - kernels run as plain Python without it
+try:
+    from numba import njit as _numba_njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# fastmath flags for the numeric kernels. 'nnan'/'ninf' are left out on
+# purpose: they let LLVM assume finite inputs, which turns a NaN fix into a
+# plausible-looking position instead of propagating it
+FASTMATH = {'contract', 'arcp', 'reassoc'}
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """
+    Compile a function with ``numba.njit`` when Numba is installed.
+    
+    Accepts the same arguments as ``numba.njit`` and can be used both bare
+    (``@njit``) and with options (``@njit(cache=True)``). Without Numba the
+    decorated function is returned unchanged.
+    """
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+    
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -1,11 +1,36 @@
 """GPS-related mathematical utilities."""
 
+import functools
 import math
 from datetime import datetime
-from typing import Dict, Any, Union
+from typing import Dict, Any, Mapping, Tuple, Union
+
+import numpy as np
+
+from ..types import GPSPoint
+from ._jit import njit, prange, FASTMATH, NUMBA_AVAILABLE
 
 EARTH_RADIUS = 6371000.0  # Earth's radius in meters
 
+# Degree/radian conversion factors (multiplying avoids a function call)
+_DEG2RAD = 0.017453292519943295  # math.pi / 180
+_RAD2DEG = 57.29577951308232  # 180 / math.pi
+
+# Largest |dphi| + |dlambda| (radians, ~64 km) for which the equirectangular
+# approximation is used instead of the full haversine formula
+_APPROX_MAX_DELTA = 0.01
+
+# Minimum number of point pairs for which haversine_distance_batch runs the
+# fused, multi-threaded Numba kernel instead of chained NumPy ufuncs
+_FUSED_MIN_SIZE = 100_000
+
+# Floating-point types accepted by the ``precision`` argument of the batch
+# functions
+_PRECISIONS = {'float32': np.float32, 'float64': np.float64}
+
+# Timestamp types _parse_time_interval subtracts directly, without parsing
+_NUMERIC_TYPES = (float, int)
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -20,11 +45,17 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         float: Distance between the two points in meters
     """
+    return _haversine(lat1, lon1, lat2, lon2)
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Scalar haversine kernel, JIT-compiled when Numba is available."""
     # Convert to radians
-    phi_1 = math.radians(lat1)
-    phi_2 = math.radians(lat2)
-    delta_phi = math.radians(lat2 - lat1)
-    delta_lambda = math.radians(lon2 - lon1)
+    phi_1 = lat1 * _DEG2RAD
+    phi_2 = lat2 * _DEG2RAD
+    delta_phi = (lat2 - lat1) * _DEG2RAD
+    delta_lambda = (lon2 - lon1) * _DEG2RAD
     
     # Haversine formula
     a = (math.sin(delta_phi / 2.0) ** 2 +
@@ -34,6 +65,195 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return EARTH_RADIUS * c
 
 
+def _precision_dtype(precision: str) -> type:
+    """Map a ``precision`` argument to its NumPy type."""
+    try:
+        return _PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(f"precision must be 'float32' or 'float64', got {precision!r}") from None
+
+
+def haversine_distance_batch(lat1: Any, lon1: Any, lat2: Any, lon2: Any,
+                             comb: bool = False,
+                             precision: str = 'float64') -> np.ndarray:
+    """
+    Calculate great-circle distances for arrays of points.
+    
+    Vectorized counterpart of haversine_distance. Inputs are broadcast
+    against each other, so a single point can be compared to a whole track.
+    For single pairs, haversine_distance is faster.
+    
+    Args:
+        lat1: Latitudes of first points in decimal degrees (array-like)
+        lon1: Longitudes of first points in decimal degrees (array-like)
+        lat2: Latitudes of second points in decimal degrees (array-like)
+        lon2: Longitudes of second points in decimal degrees (array-like)
+        comb: If True, return the matrix of distances between every first
+            point (rows) and every second point (columns)
+        precision: 'float64' (default) or 'float32'. With 'float32' the
+            coordinate differences are still taken in float64, but the
+            trigonometry runs in float32, which is several times faster
+            and accurate to well under a meter at GPS step sizes
+    
+    Returns:
+        np.ndarray: Distances in meters, of the requested precision
+    """
+    dtype = _precision_dtype(precision)
+    lat1 = np.asarray(lat1, dtype=np.float64)
+    lon1 = np.asarray(lon1, dtype=np.float64)
+    lat2 = np.asarray(lat2, dtype=np.float64)
+    lon2 = np.asarray(lon2, dtype=np.float64)
+    
+    # Large same-shape inputs: one pass over memory, no temporaries
+    if (NUMBA_AVAILABLE and dtype is np.float64 and not comb and lat1.size >= _FUSED_MIN_SIZE and
+            lat1.shape == lon1.shape == lat2.shape == lon2.shape):
+        out = np.empty(lat1.shape, dtype=np.float64)
+        _haversine_fused(np.ascontiguousarray(lat1).ravel(),
+                         np.ascontiguousarray(lon1).ravel(),
+                         np.ascontiguousarray(lat2).ravel(),
+                         np.ascontiguousarray(lon2).ravel(),
+                         out.ravel())
+        return out
+    
+    phi_1 = np.radians(lat1)
+    lambda_1 = np.radians(lon1)
+    phi_2 = np.radians(lat2)
+    lambda_2 = np.radians(lon2)
+    
+    if comb:
+        phi_1 = phi_1.reshape(-1, 1)
+        lambda_1 = lambda_1.reshape(-1, 1)
+        phi_2 = phi_2.reshape(1, -1)
+        lambda_2 = lambda_2.reshape(1, -1)
+    
+    phi_1, lambda_1, phi_2, lambda_2 = np.broadcast_arrays(phi_1, lambda_1, phi_2, lambda_2)
+    
+    # Haversine formula, asin form, reusing one buffer for the result.
+    # Differences are taken before any cast so nearby points keep their
+    # separation in float32.
+    half_dphi = ((phi_2 - phi_1) * 0.5).astype(dtype, copy=False)
+    half_dlambda = ((lambda_2 - lambda_1) * 0.5).astype(dtype, copy=False)
+    a = np.sin(half_dphi)
+    a *= a
+    b = np.sin(half_dlambda)
+    b *= b
+    b *= np.cos(phi_1.astype(dtype, copy=False))
+    b *= np.cos(phi_2.astype(dtype, copy=False))
+    a += b
+    np.minimum(a, 1.0, out=a)  # Guard against rounding just above 1
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= dtype(2.0 * EARTH_RADIUS)
+    
+    return a
+
+
+@njit(parallel=True, fastmath=FASTMATH, cache=True)
+def _haversine_fused(lat1, lon1, lat2, lon2, out):
+    """Haversine over flat arrays in a single fused, parallel loop."""
+    for i in prange(out.shape[0]):
+        phi_1 = lat1[i] * _DEG2RAD
+        phi_2 = lat2[i] * _DEG2RAD
+        a = math.sin((phi_2 - phi_1) * 0.5)
+        b = math.sin((lon2[i] - lon1[i]) * (0.5 * _DEG2RAD))
+        a = a * a + math.cos(phi_1) * math.cos(phi_2) * b * b
+        out[i] = 2.0 * EARTH_RADIUS * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def great_circle_approx(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Calculate the distance between two nearby points on Earth.
+    
+    Uses the equirectangular approximation, which needs one cosine and one
+    square root instead of the full haversine trigonometry and is accurate
+    for short hops such as consecutive GPS fixes. Falls back to
+    haversine_distance when the points are far apart.
+    
+    Args:
+        lat1: Latitude of first point in decimal degrees
+        lon1: Longitude of first point in decimal degrees
+        lat2: Latitude of second point in decimal degrees
+        lon2: Longitude of second point in decimal degrees
+    
+    Returns:
+        float: Distance between the two points in meters
+    """
+    delta_phi = (lat2 - lat1) * _DEG2RAD
+    delta_lambda = (lon2 - lon1) * _DEG2RAD
+    
+    if abs(delta_phi) + abs(delta_lambda) > _APPROX_MAX_DELTA:
+        return haversine_distance(lat1, lon1, lat2, lon2)
+    
+    x = delta_lambda * math.cos(0.5 * (lat1 + lat2) * _DEG2RAD)
+    return EARTH_RADIUS * math.hypot(x, delta_phi)
+
+
+def _point_latlon(point: Mapping[str, Any]) -> Tuple[float, float]:
+    """
+    Extract latitude and longitude from a GPS point or position.
+    
+    The canonical 'latitude'/'longitude' keys (as produced by GpsReader)
+    are read with plain indexing; the 'lat'/'lon' aliases are only looked
+    up when those are missing, instead of evaluating both on every call.
+    Missing coordinates default to 0.0.
+    
+    Args:
+        point: GPSPoint or dictionary with coordinates
+    
+    Returns:
+        Tuple[float, float]: (latitude, longitude)
+    """
+    if type(point) is GPSPoint:
+        return point.latitude, point.longitude
+    try:
+        return float(point['latitude']), float(point['longitude'])
+    except KeyError:
+        return (float(point.get('latitude', point.get('lat', 0.0))),
+                float(point.get('longitude', point.get('lon', 0.0))))
+
+
+def _point_fields(point: Mapping[str, Any]) -> Tuple[float, float, Any]:
+    """
+    Extract latitude, longitude and timestamp from a GPS point.
+    
+    Args:
+        point: GPSPoint or GPS point dictionary (see ``_point_latlon``)
+    
+    Returns:
+        Tuple[float, float, Any]: (latitude, longitude, timestamp)
+    """
+    if type(point) is GPSPoint:
+        return point.latitude, point.longitude, point.timestamp
+    return _point_latlon(point) + (point['timestamp'],)
+
+
+def _pair_fields(previous_point: Mapping[str, Any],
+                 current_point: Mapping[str, Any]) -> Tuple[float, float, Any, float, float, Any]:
+    """
+    Extract coordinates and timestamps from two consecutive GPS points.
+    
+    Typed points need no key lookups; dictionaries are read with their
+    canonical keys first, falling back to ``_point_fields`` for aliases.
+    
+    Args:
+        previous_point: Previous GPSPoint or GPS point dictionary
+        current_point: Current GPSPoint or GPS point dictionary
+    
+    Returns:
+        Tuple: (prev_lat, prev_lon, prev_ts, curr_lat, curr_lon, curr_ts)
+    """
+    if type(previous_point) is GPSPoint and type(current_point) is GPSPoint:
+        return (previous_point.latitude, previous_point.longitude, previous_point.timestamp,
+                current_point.latitude, current_point.longitude, current_point.timestamp)
+    try:
+        return (float(previous_point['latitude']), float(previous_point['longitude']),
+                previous_point['timestamp'],
+                float(current_point['latitude']), float(current_point['longitude']),
+                current_point['timestamp'])
+    except KeyError:
+        return _point_fields(previous_point) + _point_fields(current_point)
+
+
 def compute_velocity(previous_point: Dict[str, Any], 
                     current_point: Dict[str, Any]) -> float:
     """
@@ -52,27 +272,165 @@ def compute_velocity(previous_point: Dict[str, Any],
     if previous_point is None:
         return 0.0
     
-    # Extract coordinates
-    prev_lat = float(previous_point.get('latitude', previous_point.get('lat', 0.0)))
-    prev_lon = float(previous_point.get('longitude', previous_point.get('lon', 0.0)))
-    curr_lat = float(current_point.get('latitude', current_point.get('lat', 0.0)))
-    curr_lon = float(current_point.get('longitude', current_point.get('lon', 0.0)))
-    
-    # Extract and parse timestamps
-    prev_ts = previous_point['timestamp']
-    curr_ts = current_point['timestamp']
+    (prev_lat, prev_lon, prev_ts,
+     curr_lat, curr_lon, curr_ts) = _pair_fields(previous_point, current_point)
     
     time_interval = _parse_time_interval(prev_ts, curr_ts)
     
     if time_interval <= 0.0:
         return 0.0
     
-    # Calculate distance
-    distance = haversine_distance(prev_lat, prev_lon, curr_lat, curr_lon)
+    # Calculate distance (consecutive fixes are close, so use the fast path)
+    distance = great_circle_approx(prev_lat, prev_lon, curr_lat, curr_lon)
     
     return distance / time_interval
 
 
+def velocity_exceeds(previous_point: Dict[str, Any],
+                     current_point: Dict[str, Any],
+                     threshold: float) -> bool:
+    """
+    Check whether the velocity between two GPS points exceeds a threshold.
+    
+    Same result as ``compute_velocity(previous_point, current_point) >
+    threshold``, but compares squared angular distances so the square root
+    and division are skipped for the common short-hop case.
+    
+    Args:
+        previous_point: Previous GPS point (see compute_velocity)
+        current_point: Current GPS point with same structure
+        threshold: Velocity threshold in meters per second
+    
+    Returns:
+        bool: True if the velocity is above the threshold
+    """
+    (prev_lat, prev_lon, prev_ts,
+     curr_lat, curr_lon, curr_ts) = _pair_fields(previous_point, current_point)
+    
+    time_interval = _parse_time_interval(prev_ts, curr_ts)
+    
+    if time_interval <= 0.0:
+        return False
+    
+    delta_phi = (curr_lat - prev_lat) * _DEG2RAD
+    delta_lambda = (curr_lon - prev_lon) * _DEG2RAD
+    
+    if abs(delta_phi) + abs(delta_lambda) > _APPROX_MAX_DELTA:
+        distance = haversine_distance(prev_lat, prev_lon, curr_lat, curr_lon)
+        return distance > threshold * time_interval
+    
+    # Equirectangular distance, compared in squared radians
+    x = delta_lambda * math.cos(0.5 * (prev_lat + curr_lat) * _DEG2RAD)
+    max_angle = threshold * time_interval / EARTH_RADIUS
+    return x * x + delta_phi * delta_phi > max_angle * max_angle
+
+
+def compute_velocity_batch(latitudes: Any, longitudes: Any, timestamps: Any,
+                           precision: str = 'float64') -> np.ndarray:
+    """
+    Compute velocities between consecutive points of a track.
+    
+    Vectorized counterpart of compute_velocity. Like great_circle_approx
+    it uses an equirectangular approximation, but scales the longitude
+    difference by the mean of the two endpoint cosines rather than the
+    cosine of the mean latitude, so the cosine of each latitude is computed
+    once and shared by the two segments that touch it. The two differ by
+    a relative O(delta_phi**2), far below a millimetre for consecutive
+    fixes. As in great_circle_approx, segments too long for the
+    approximation fall back to the haversine formula.
+    
+    Args:
+        latitudes: Latitudes in decimal degrees (array-like, length n)
+        longitudes: Longitudes in decimal degrees (array-like, length n)
+        timestamps: Unix timestamps in seconds (array-like, length n)
+        precision: 'float64' (default) or 'float32'; see
+            haversine_distance_batch. Differences of coordinates and
+            timestamps are always taken in float64
+    
+    Returns:
+        np.ndarray: Velocities in m/s (length n - 1), of the requested
+            precision; 0.0 where the time interval is not positive
+    """
+    dtype = _precision_dtype(precision)
+    lats = np.asarray(latitudes, dtype=np.float64)
+    lons = np.asarray(longitudes, dtype=np.float64)
+    ts = np.asarray(timestamps, dtype=np.float64)
+    
+    phi = lats * _DEG2RAD
+    cos_phi = np.cos(phi.astype(dtype, copy=False))
+    delta_phi = np.diff(phi).astype(dtype, copy=False)
+    delta_lambda = (np.diff(lons) * _DEG2RAD).astype(dtype, copy=False)
+    
+    # Mean of the endpoint cosines instead of the cosine of the mean latitude
+    x = delta_lambda * (dtype(0.5) * (cos_phi[:-1] + cos_phi[1:]))
+    distance = dtype(EARTH_RADIUS) * np.hypot(x, delta_phi)
+    
+    far = np.abs(delta_phi) + np.abs(delta_lambda) > _APPROX_MAX_DELTA
+    if far.any():
+        idx = np.flatnonzero(far)
+        distance[idx] = haversine_distance_batch(lats[idx], lons[idx],
+                                                 lats[idx + 1], lons[idx + 1],
+                                                 precision=precision)
+    
+    dt = np.diff(ts)
+    velocity = np.zeros_like(distance)
+    np.divide(distance, dt, out=velocity, where=dt > 0.0)
+    return velocity
+
+
+def velocity_exceeds_batch(latitudes: Any, longitudes: Any, timestamps: Any,
+                           threshold: float, precision: str = 'float64') -> np.ndarray:
+    """
+    Check which consecutive segments of a track exceed a velocity threshold.
+    
+    Vectorized counterpart of velocity_exceeds: same result as
+    ``compute_velocity_batch(...) > threshold``, but squared angular
+    distances are compared with the squared angle allowed per time step,
+    so no square root or division is computed for short hops.
+    
+    Args:
+        latitudes: Latitudes in decimal degrees (array-like, length n)
+        longitudes: Longitudes in decimal degrees (array-like, length n)
+        timestamps: Unix timestamps in seconds (array-like, length n)
+        threshold: Velocity threshold in meters per second
+        precision: 'float64' (default) or 'float32'; see
+            compute_velocity_batch
+    
+    Returns:
+        np.ndarray: Boolean mask (length n - 1), True where the velocity is
+            above the threshold; False where the time interval is not positive
+    """
+    dtype = _precision_dtype(precision)
+    lats = np.asarray(latitudes, dtype=np.float64)
+    lons = np.asarray(longitudes, dtype=np.float64)
+    ts = np.asarray(timestamps, dtype=np.float64)
+    
+    phi = lats * _DEG2RAD
+    cos_phi = np.cos(phi.astype(dtype, copy=False))
+    delta_phi = np.diff(phi).astype(dtype, copy=False)
+    delta_lambda = (np.diff(lons) * _DEG2RAD).astype(dtype, copy=False)
+    
+    x = delta_lambda * (dtype(0.5) * (cos_phi[:-1] + cos_phi[1:]))
+    x *= x
+    x += delta_phi * delta_phi
+    
+    dt = np.diff(ts)
+    max_angle = (dt * (threshold / EARTH_RADIUS)).astype(dtype, copy=False)
+    max_angle *= max_angle
+    exceeds = x > max_angle
+    exceeds &= dt > 0.0
+    
+    far = np.abs(delta_phi) + np.abs(delta_lambda) > _APPROX_MAX_DELTA
+    if far.any():
+        idx = np.flatnonzero(far)
+        distance = haversine_distance_batch(lats[idx], lons[idx],
+                                            lats[idx + 1], lons[idx + 1],
+                                            precision=precision)
+        exceeds[idx] = (distance > threshold * dt[idx]) & (dt[idx] > 0.0)
+    
+    return exceeds
+
+
 def _parse_time_interval(prev_ts: Union[str, float, int], 
                         curr_ts: Union[str, float, int]) -> float:
     """
@@ -85,14 +443,16 @@ def _parse_time_interval(prev_ts: Union[str, float, int],
     Returns:
         float: Time interval in seconds
     """
+    # Numeric timestamps are the common case; skip the string handling
+    if type(prev_ts) in _NUMERIC_TYPES and type(curr_ts) in _NUMERIC_TYPES:
+        return float(curr_ts - prev_ts)
+    
     try:
         # Handle ISO format strings
         if isinstance(prev_ts, str) and isinstance(curr_ts, str):
-            prev_time = datetime.fromisoformat(prev_ts.replace('Z', '+00:00'))
-            curr_time = datetime.fromisoformat(curr_ts.replace('Z', '+00:00'))
-            return (curr_time - prev_time).total_seconds()
+            return (_parse_iso(curr_ts) - _parse_iso(prev_ts)).total_seconds()
         
-        # Handle numeric timestamps
+        # Handle other numeric-like timestamps
         return float(curr_ts) - float(prev_ts)
         
     except (ValueError, KeyError, TypeError):
@@ -100,6 +460,19 @@ def _parse_time_interval(prev_ts: Union[str, float, int],
         return 0.0
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(ts: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+    
+    Cached because in a stream each timestamp is parsed twice: once as the
+    current point and once more as the previous point of the next pair.
+    The datetime itself is cached rather than an epoch value, so naive
+    timestamps are never interpreted in the host's local timezone.
+    """
+    return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+
+
 def bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the bearing (direction) from point 1 to point 2.
@@ -113,16 +486,22 @@ def bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     Returns:
         float: Bearing in degrees (0-360, where 0 is North)
     """
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lon_rad = math.radians(lon2 - lon1)
+    return _bearing(lat1, lon1, lat2, lon2)
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Scalar initial-bearing kernel, JIT-compiled when Numba is available."""
+    lat1_rad = lat1 * _DEG2RAD
+    lat2_rad = lat2 * _DEG2RAD
+    delta_lon_rad = (lon2 - lon1) * _DEG2RAD
     
     y = math.sin(delta_lon_rad) * math.cos(lat2_rad)
     x = (math.cos(lat1_rad) * math.sin(lat2_rad) -
          math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(delta_lon_rad))
     
     bearing_rad = math.atan2(y, x)
-    bearing_deg = math.degrees(bearing_rad)
+    bearing_deg = bearing_rad * _RAD2DEG
     
     # Normalize to 0-360 degrees
     return (bearing_deg + 360) % 360
@@ -139,4 +518,24 @@ def validate_coordinates(lat: float, lon: float) -> bool:
     Returns:
         bool: True if coordinates are valid
     """
-    return -90 <= lat <= 90 and -180 <= lon <= 180
\ No newline at end of file
+    return abs(lat) <= 90.0 and abs(lon) <= 180.0
+
+
+def validate_coordinates_batch(lats: Any, lons: Any) -> np.ndarray:
+    """
+    Validate arrays of coordinates.
+    
+    Vectorized counterpart of validate_coordinates, suitable for masking
+    out invalid rows before distance computations. NaN coordinates are
+    reported as invalid.
+    
+    Args:
+        lats: Latitudes in decimal degrees (array-like)
+        lons: Longitudes in decimal degrees (array-like)
+    
+    Returns:
+        np.ndarray: Boolean mask, True where coordinates are valid
+    """
+    valid = np.abs(np.asarray(lats, dtype=np.float64)) <= 90.0
+    valid &= np.abs(np.asarray(lons, dtype=np.float64)) <= 180.0
+    return valid
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Visualization modules for GPS spoofing detection."""
 
 from .live_plotter import LivePathPlotter
+from .backends import PlotBackend, MatplotlibBackend, PyQtGraphBackend
 
-__all__ = ["LivePathPlotter"]
\ No newline at end of file
+__all__ = ["LivePathPlotter", "PlotBackend", "MatplotlibBackend", "PyQtGraphBackend"]
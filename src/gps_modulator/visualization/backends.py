@@ -0,0 +1,347 @@
+"""Rendering backends for the live GPS path plotter."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+# Optional dependency - only import when needed
+try:
+    import pyqtgraph as pg
+    from pyqtgraph.Qt import QtCore
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+
+
+class PlotBackend(ABC):
+    """
+    Abstract base class for live plot renderers.
+
+    A backend owns the window and the drawn artists; LivePathPlotter owns
+    the data and hands the visible arrays to ``draw`` on every frame.
+    """
+
+    def __init__(self, title: str) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            title: Plot title
+        """
+        self.title = title
+
+    @abstractmethod
+    def setup(self) -> None:
+        """Create the window and the empty artists."""
+        pass
+
+    @abstractmethod
+    def draw(self,
+             raw_lons: np.ndarray, raw_lats: np.ndarray,
+             corrected_lons: np.ndarray, corrected_lats: np.ndarray,
+             spoofed_lons: np.ndarray, spoofed_lats: np.ndarray) -> Tuple[Any, ...]:
+        """
+        Push new data to the artists.
+
+        Returns:
+            Tuple of updated artists
+        """
+        pass
+
+    @abstractmethod
+    def start(self, update: Callable[[Any], Any], interval: int) -> None:
+        """
+        Call ``update`` periodically to refresh the plot.
+
+        Args:
+            update: Frame callback, receives an opaque frame argument
+            interval: Update interval in milliseconds
+        """
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop periodic updates."""
+        pass
+
+    def reset(self) -> None:
+        """Forget any view state derived from previously drawn data."""
+        pass
+
+    def render(self, artists: Tuple[Any, ...]) -> np.ndarray:
+        """
+        Render the current figure to an image.
+
+        Args:
+            artists: Artists returned by the last ``draw`` call
+
+        Returns:
+            np.ndarray: RGB image of shape (height, width, 3), dtype uint8
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support rendering to an array")
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the window."""
+        pass
+
+    @property
+    @abstractmethod
+    def is_setup(self) -> bool:
+        """Whether ``setup`` has created a window."""
+        pass
+
+
+class MatplotlibBackend(PlotBackend):
+    """
+    Matplotlib renderer using a blitted FuncAnimation.
+
+    Axes limits only change when the data leaves the current view, so most
+    frames only redraw the animated artists. With ``interactive=False`` the
+    figure is bound to an Agg canvas and never touches a GUI event loop;
+    frames are then produced with ``render``. pyplot (and with it GUI
+    backend selection) is only imported for interactive use.
+    """
+
+    def __init__(self, title: str, interactive: bool = True) -> None:
+        """
+        Initialize the matplotlib backend.
+
+        Args:
+            title: Plot title
+            interactive: Whether to open a pyplot window (default: True)
+        """
+        super().__init__(title)
+        self.interactive = interactive
+        self.fig: Optional[Figure] = None
+        self.ax: Optional[Axes] = None
+        self.raw_line: Optional[Line2D] = None
+        self.corrected_line: Optional[Line2D] = None
+        self.spoofed_scatter: Optional[Line2D] = None
+        self._animation = None
+
+        # Current view limits (lon_min, lon_max, lat_min, lat_max); only
+        # changed when the data leaves the view so blitting stays valid
+        self._view: Optional[Tuple[float, float, float, float]] = None
+
+    @property
+    def is_setup(self) -> bool:
+        return self.fig is not None
+
+    def setup(self) -> None:
+        """Initialize the matplotlib plot."""
+        if self.interactive:
+            import matplotlib.pyplot as plt
+            self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        else:
+            # Off-screen figure, not registered with pyplot
+            self.fig = Figure(figsize=(12, 8))
+            FigureCanvasAgg(self.fig)
+            self.ax = self.fig.add_subplot()
+
+        # Initialize empty lines (they become animated only once a blitting
+        # animation is started, so plain draws and savefig still show them)
+        self.raw_line, = self.ax.plot([], [], 'b-', alpha=0.6,
+                                      label='Raw GPS Path', linewidth=2)
+        self.corrected_line, = self.ax.plot([], [], 'g-',
+                                          label='Corrected Path', linewidth=2)
+
+        # Spoofed points share one color and size, so a marker-only line
+        # is used instead of a scatter (no per-point offsets or colors)
+        self.spoofed_scatter, = self.ax.plot([], [], linestyle='None',
+                                             marker='o', markersize=7,
+                                             color='red', alpha=0.7,
+                                             label='Detected Spoofing')
+        self._view = None
+
+        # Configure plot
+        self.ax.set_xlabel('Longitude')
+        self.ax.set_ylabel('Latitude')
+        self.ax.set_title(self.title)
+        self.ax.grid(True, alpha=0.3)
+        self.ax.legend()
+
+        # Enable interactive mode
+        if self.interactive:
+            plt.ion()
+
+    def draw(self,
+             raw_lons: np.ndarray, raw_lats: np.ndarray,
+             corrected_lons: np.ndarray, corrected_lats: np.ndarray,
+             spoofed_lons: np.ndarray, spoofed_lats: np.ndarray
+             ) -> Tuple[Line2D, Line2D, Line2D]:
+        """Update line and marker data, rescaling only when needed."""
+        self.raw_line.set_data(raw_lons, raw_lats)
+        self.corrected_line.set_data(corrected_lons, corrected_lats)
+        self.spoofed_scatter.set_data(spoofed_lons, spoofed_lats)
+
+        if len(raw_lats):
+            self._update_view(raw_lats.min(), raw_lats.max(),
+                              raw_lons.min(), raw_lons.max())
+
+        return self.raw_line, self.corrected_line, self.spoofed_scatter
+
+    def _update_view(self, lat_min: float, lat_max: float,
+                     lon_min: float, lon_max: float) -> None:
+        """Expand the axes limits only when the data leaves the current view."""
+        view = self._view
+        if (view is not None and
+                view[0] <= lon_min and lon_max <= view[1] and
+                view[2] <= lat_min and lat_max <= view[3]):
+            return
+
+        # Add 20% padding so the path can grow for a while before the
+        # next (full, non-blitted) redraw is needed
+        lat_padding = (lat_max - lat_min) * 0.2 or 0.001
+        lon_padding = (lon_max - lon_min) * 0.2 or 0.001
+
+        self._view = (lon_min - lon_padding, lon_max + lon_padding,
+                      lat_min - lat_padding, lat_max + lat_padding)
+        self.ax.set_xlim(self._view[0], self._view[1])
+        self.ax.set_ylim(self._view[2], self._view[3])
+
+        # Ticks and grid live in the blit background, so refresh it
+        self.fig.canvas.draw_idle()
+
+    def start(self, update: Callable[[Any], Any], interval: int) -> None:
+        """Start a blitted FuncAnimation driving ``update``."""
+        import matplotlib.animation as animation
+        import matplotlib.pyplot as plt
+        
+        # Force window to front and maximize
+        try:
+            plt.get_current_fig_manager().window.state('zoomed')
+        except Exception:
+            pass
+
+        # Blitted artists are drawn by the animation only
+        for artist in (self.raw_line, self.corrected_line, self.spoofed_scatter):
+            artist.set_animated(True)
+
+        self._animation = animation.FuncAnimation(
+            self.fig,
+            update,
+            interval=interval,
+            blit=True,
+            cache_frame_data=False
+        )
+
+        plt.show(block=False)
+        plt.pause(0.1)  # Ensure window renders
+
+    def render(self, artists: Tuple[Any, ...]) -> np.ndarray:
+        """Draw the figure, including the animated artists, to an RGB array."""
+        canvas = self.fig.canvas
+        canvas.draw()
+        # Animated artists are skipped by a normal draw
+        for artist in artists:
+            if artist.get_animated():
+                self.ax.draw_artist(artist)
+        return np.asarray(canvas.buffer_rgba())[..., :3].copy()
+
+    def stop(self) -> None:
+        """Stop the animation."""
+        if self._animation:
+            self._animation.event_source.stop()
+            for artist in (self.raw_line, self.corrected_line, self.spoofed_scatter):
+                artist.set_animated(False)
+
+    def reset(self) -> None:
+        """Recompute the view on the next frame."""
+        self._view = None
+
+    def close(self) -> None:
+        """Close the plot window."""
+        if self.fig:
+            if self.interactive:
+                import matplotlib.pyplot as plt
+                plt.close(self.fig)
+            self.fig = None
+            self.ax = None
+
+
+class PyQtGraphBackend(PlotBackend):
+    """
+    pyqtgraph renderer for high point counts and frame rates.
+
+    Curves are updated with ``setData`` straight from NumPy arrays and
+    pyqtgraph's auto-range handles the view, so frames cost roughly one
+    C++ call per artist regardless of axes decoration.
+    """
+
+    def __init__(self, title: str) -> None:
+        """
+        Initialize the pyqtgraph backend.
+
+        Args:
+            title: Plot title
+        """
+        if not PYQTGRAPH_AVAILABLE:
+            raise ImportError("pyqtgraph is required. Install with: pip install pyqtgraph")
+
+        super().__init__(title)
+        self.app = None
+        self.widget = None
+        self.raw_curve = None
+        self.corrected_curve = None
+        self.spoofed_scatter = None
+        self._timer = None
+
+    @property
+    def is_setup(self) -> bool:
+        return self.widget is not None
+
+    def setup(self) -> None:
+        """Create the plot widget and curves."""
+        self.app = pg.mkQApp()
+        self.widget = pg.PlotWidget(title=self.title)
+        self.widget.setLabel('bottom', 'Longitude')
+        self.widget.setLabel('left', 'Latitude')
+        self.widget.showGrid(x=True, y=True, alpha=0.3)
+        self.widget.addLegend()
+
+        self.raw_curve = self.widget.plot(
+            pen=pg.mkPen((0, 0, 255, 153), width=2), name='Raw GPS Path'
+        )
+        self.corrected_curve = self.widget.plot(
+            pen=pg.mkPen('g', width=2), name='Corrected Path'
+        )
+        self.spoofed_scatter = pg.ScatterPlotItem(
+            size=8, pen=None, brush=pg.mkBrush(255, 0, 0, 178), name='Detected Spoofing'
+        )
+        self.widget.addItem(self.spoofed_scatter)
+        self.widget.show()
+
+    def draw(self,
+             raw_lons: np.ndarray, raw_lats: np.ndarray,
+             corrected_lons: np.ndarray, corrected_lats: np.ndarray,
+             spoofed_lons: np.ndarray, spoofed_lats: np.ndarray) -> Tuple[Any, ...]:
+        """Push arrays to the curves and scatter."""
+        self.raw_curve.setData(raw_lons, raw_lats)
+        self.corrected_curve.setData(corrected_lons, corrected_lats)
+        self.spoofed_scatter.setData(spoofed_lons, spoofed_lats)
+        return self.raw_curve, self.corrected_curve, self.spoofed_scatter
+
+    def start(self, update: Callable[[Any], Any], interval: int) -> None:
+        """Drive ``update`` from a Qt timer."""
+        self._timer = QtCore.QTimer()
+        self._timer.timeout.connect(lambda: update(None))
+        self._timer.start(interval)
+        self.app.processEvents()  # Ensure window renders
+
+    def stop(self) -> None:
+        """Stop the update timer."""
+        if self._timer:
+            self._timer.stop()
+
+    def close(self) -> None:
+        """Close the plot widget."""
+        if self.widget:
+            self.stop()
+            self.widget.close()
+            self.widget = None
@@ -1,13 +1,16 @@
 """Real-time GPS path visualization with spoofing detection."""
 
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.collections import PathCollection
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
-import threading
+from typing import List, Dict, Any, Optional, Tuple, Union
 import time
 
+from .backends import PlotBackend, MatplotlibBackend, PyQtGraphBackend
+
+_BACKENDS = {
+    'matplotlib': MatplotlibBackend,
+    'pyqtgraph': PyQtGraphBackend,
+}
+
 
 class LivePathPlotter:
     """
@@ -17,60 +20,67 @@ class LivePathPlotter:
     raw and corrected paths with visual indicators for detected spoofing.
     """
     
-    def __init__(self, max_points: int = 1000, title: str = "GPS Spoofing Detection"):
+    def __init__(self, max_points: int = 1000, title: str = "GPS Spoofing Detection",
+                 display_points: Optional[int] = None,
+                 backend: Union[str, PlotBackend] = 'matplotlib',
+                 interactive: bool = True):
         """
         Initialize the live path plotter.
         
         Args:
             max_points: Maximum number of points to display on plot
             title: Plot title
+            display_points: Maximum number of path vertices drawn per frame;
+                longer paths are decimated by stride (default: max_points)
+            backend: 'matplotlib' (default), 'pyqtgraph', or a PlotBackend
+                instance used for rendering
+            interactive: Open a GUI window; set to False with the matplotlib
+                backend to render frames off-screen with render_frame
         """
         self.max_points = max_points
         self.title = title
+        self.display_points = display_points or max_points
         
-        # Data storage
-        self.raw_lats: List[float] = []
-        self.raw_lons: List[float] = []
-        self.corrected_lats: List[float] = []
-        self.corrected_lons: List[float] = []
-        self.spoofed_indices: List[int] = []
-        
-        # Plotting state
-        self.fig: Optional[plt.Figure] = None
-        self.ax: Optional[plt.Axes] = None
-        self.raw_line: Optional[plt.Line2D] = None
-        self.corrected_line: Optional[plt.Line2D] = None
-        self.spoofed_scatter: Optional[PathCollection] = None
-        
-        # Threading
-        self._lock = threading.Lock()
-        self._animation: Optional[animation.FuncAnimation] = None
+        if isinstance(backend, str):
+            if backend not in _BACKENDS:
+                raise ValueError(f"Unknown plot backend: {backend}")
+            if backend == 'matplotlib':
+                backend = MatplotlibBackend(title, interactive=interactive)
+            else:
+                backend = _BACKENDS[backend](title)
+        self.backend = backend
+        
+        # Data storage: preallocated ring buffers, one array per field. They
+        # hold twice the displayed window so the producer can keep writing
+        # past a snapshot being copied without touching the slots it reads
+        self._capacity = 2 * max_points
+        self._raw_lat = np.empty(self._capacity, dtype=np.float64)
+        self._raw_lon = np.empty(self._capacity, dtype=np.float64)
+        self._corrected_lat = np.empty(self._capacity, dtype=np.float64)
+        self._corrected_lon = np.empty(self._capacity, dtype=np.float64)
+        self._spoofed = np.zeros(self._capacity, dtype=np.bool_)
+        
+        # Threading: lock-free single producer / single consumer. add_point
+        # fills a slot, then publishes it by bumping _written (total points
+        # ever added); clear() publishes a new _start instead of touching
+        # the buffers. Readers snapshot both and validate their copy
+        self._written = 0
+        self._start = 0
         self._is_running = False
     
+    @property
+    def fig(self) -> Any:
+        """Matplotlib figure, when using the matplotlib backend."""
+        return getattr(self.backend, 'fig', None)
+    
+    @property
+    def ax(self) -> Any:
+        """Matplotlib axes, when using the matplotlib backend."""
+        return getattr(self.backend, 'ax', None)
+    
     def setup_plot(self) -> None:
-        """Initialize the matplotlib plot."""
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
-        
-        # Initialize empty lines
-        self.raw_line, = self.ax.plot([], [], 'b-', alpha=0.6, 
-                                      label='Raw GPS Path', linewidth=2)
-        self.corrected_line, = self.ax.plot([], [], 'g-', 
-                                          label='Corrected Path', linewidth=2)
-        
-        # Initialize empty scatter for spoofed points
-        self.spoofed_scatter = self.ax.scatter([], [], c='red', 
-                                             s=50, alpha=0.7, 
-                                             label='Detected Spoofing')
-        
-        # Configure plot
-        self.ax.set_xlabel('Longitude')
-        self.ax.set_ylabel('Latitude')
-        self.ax.set_title(self.title)
-        self.ax.grid(True, alpha=0.3)
-        self.ax.legend()
-        
-        # Enable interactive mode
-        plt.ion()
+        """Initialize the plot window."""
+        self.backend.setup()
     
     def add_point(self, 
                   raw_point: Dict[str, float],
@@ -84,41 +94,70 @@ class LivePathPlotter:
             corrected_point: Corrected GPS point (if available)
             is_spoofed: Whether this point was detected as spoofed
         """
-        with self._lock:
-            # Add raw coordinates
-            self.raw_lats.append(raw_point['latitude'])
-            self.raw_lons.append(raw_point['longitude'])
-            
-            # Add corrected coordinates
-            if corrected_point:
-                self.corrected_lats.append(corrected_point['latitude'])
-                self.corrected_lons.append(corrected_point['longitude'])
+        # Use raw point if no correction
+        if not corrected_point:
+            corrected_point = raw_point
+        
+        # Fill the slot first, then publish it; once more than max_points
+        # are buffered the oldest drop out of the displayed window
+        written = self._written
+        slot = written % self._capacity
+        self._raw_lat[slot] = raw_point['latitude']
+        self._raw_lon[slot] = raw_point['longitude']
+        self._corrected_lat[slot] = corrected_point['latitude']
+        self._corrected_lon[slot] = corrected_point['longitude']
+        self._spoofed[slot] = is_spoofed
+        self._written = written + 1
+    
+    def _snapshot(self, *buffers: np.ndarray) -> List[np.ndarray]:
+        """
+        Copy the displayed window of each ring buffer, oldest point first.
+        
+        Works like a seqlock: the window is copied without locking and the
+        copy is retried if, meanwhile, the producer wrapped far enough to
+        overwrite one of the copied slots.
+        """
+        capacity = self._capacity
+        while True:
+            written = self._written
+            count = min(max(written - self._start, 0), self.max_points)
+            first = (written - count) % capacity
+            end = written % capacity
+            if first <= end:
+                copies = [buffer[first:end].copy() for buffer in buffers]
             else:
-                # Use raw point if no correction
-                self.corrected_lats.append(raw_point['latitude'])
-                self.corrected_lons.append(raw_point['longitude'])
-            
-            # Track spoofed indices
-            if is_spoofed:
-                self.spoofed_indices.append(len(self.raw_lats) - 1)
-            
-            # Limit data to max_points
-            self._limit_data()
-    
-    def _limit_data(self) -> None:
-        """Limit stored data to max_points."""
-        if len(self.raw_lats) > self.max_points:
-            self.raw_lats = self.raw_lats[-self.max_points:]
-            self.raw_lons = self.raw_lons[-self.max_points:]
-            self.corrected_lats = self.corrected_lats[-self.max_points:]
-            self.corrected_lons = self.corrected_lons[-self.max_points:]
-            
-            # Adjust spoofed indices
-            offset = len(self.raw_lats) - len(self.spoofed_indices)
-            self.spoofed_indices = [i - offset for i in self.spoofed_indices 
-                                  if i >= offset]
+                copies = [np.concatenate((buffer[first:], buffer[:end])) for buffer in buffers]
+            # Slots at or past ``written`` were free while copying; the
+            # window is intact unless the producer ran into its oldest slot
+            if self._written - written < capacity - count:
+                return copies
+    
+    @property
+    def raw_lats(self) -> np.ndarray:
+        """Raw latitudes currently displayed, oldest first."""
+        return self._snapshot(self._raw_lat)[0]
+    
+    @property
+    def raw_lons(self) -> np.ndarray:
+        """Raw longitudes currently displayed, oldest first."""
+        return self._snapshot(self._raw_lon)[0]
+    
+    @property
+    def corrected_lats(self) -> np.ndarray:
+        """Corrected latitudes currently displayed, oldest first."""
+        return self._snapshot(self._corrected_lat)[0]
+    
+    @property
+    def corrected_lons(self) -> np.ndarray:
+        """Corrected longitudes currently displayed, oldest first."""
+        return self._snapshot(self._corrected_lon)[0]
     
-    def update_plot(self, frame: Any) -> Tuple[plt.Line2D, plt.Line2D, PathCollection]:
+    @property
+    def spoofed_indices(self) -> List[int]:
+        """Positions of spoofed points within the displayed data."""
+        return np.flatnonzero(self._snapshot(self._spoofed)[0]).tolist()
+    
+    def update_plot(self, frame: Any) -> Tuple[Any, ...]:
         """
         Update the plot with current data.
         
@@ -128,43 +167,50 @@ class LivePathPlotter:
         Returns:
             Tuple of updated plot elements
         """
-        with self._lock:
-            if not self.raw_lats:
-                return self.raw_line, self.corrected_line, self.spoofed_scatter
-            
-            # Update raw path
-            self.raw_line.set_data(self.raw_lons, self.raw_lats)
-            
-            # Update corrected path
-            self.corrected_line.set_data(self.corrected_lons, self.corrected_lats)
-            
-            # Update spoofed points
-            if self.spoofed_indices:
-                spoofed_lats = [self.raw_lats[i] for i in self.spoofed_indices 
-                               if i < len(self.raw_lats)]
-                spoofed_lons = [self.raw_lons[i] for i in self.spoofed_indices 
-                               if i < len(self.raw_lons)]
-                
-                if spoofed_lats and spoofed_lons:
-                    self.spoofed_scatter.set_offsets(
-                        list(zip(spoofed_lons, spoofed_lats))
-                    )
-            else:
-                self.spoofed_scatter.set_offsets(np.empty((0, 2)))
+        # Assemble the visible window only when drawing, as one consistent
+        # snapshot while the producer keeps writing
+        raw_lats, raw_lons, corrected_lats, corrected_lons, spoofed = self._snapshot(
+            self._raw_lat, self._raw_lon, self._corrected_lat, self._corrected_lon, self._spoofed)
+        count = len(raw_lats)
+        
+        # Spoofed points are always drawn, even when the path is decimated
+        spoofed_lats = raw_lats[spoofed]
+        spoofed_lons = raw_lons[spoofed]
+        
+        # Decimate long paths by stride, keeping the newest point
+        if count > self.display_points:
+            idx = np.linspace(0, count - 1, self.display_points, dtype=int)
+            raw_lats = raw_lats[idx]
+            raw_lons = raw_lons[idx]
+            corrected_lats = corrected_lats[idx]
+            corrected_lons = corrected_lons[idx]
+        
+        return self.backend.draw(raw_lons, raw_lats,
+                                 corrected_lons, corrected_lats,
+                                 spoofed_lons, spoofed_lats)
+    
+    def render_frame(self) -> np.ndarray:
+        """
+        Draw the current data and return the frame as an image.
+        
+        Does not need a GUI event loop when the plotter was created with
+        ``interactive=False``, so frames can be produced as fast as they
+        are drawn (e.g. for benchmarks or piping to a video encoder).
+        
+        Returns:
+            np.ndarray: RGB image of shape (height, width, 3), dtype uint8
             
-            # Auto-scale axes
-            if self.raw_lats:
-                lat_min, lat_max = min(self.raw_lats), max(self.raw_lats)
-                lon_min, lon_max = min(self.raw_lons), max(self.raw_lons)
-                
-                # Add padding
-                lat_padding = (lat_max - lat_min) * 0.1 or 0.001
-                lon_padding = (lon_max - lon_min) * 0.1 or 0.001
-                
-                self.ax.set_xlim(lon_min - lon_padding, lon_max + lon_padding)
-                self.ax.set_ylim(lat_min - lat_padding, lat_max + lat_padding)
-        
-        return self.raw_line, self.corrected_line, self.spoofed_scatter
+        Raises:
+            ValueError: If the backend cannot render to an array
+        """
+        if type(self.backend).render is PlotBackend.render:
+            raise ValueError(f"{type(self.backend).__name__} does not support render_frame; "
+                             "use the matplotlib backend with interactive=False")
+        
+        if not self.backend.is_setup:
+            self.setup_plot()
+        
+        return self.backend.render(self.update_plot(None))
     
     def start_animation(self, interval: int = 100) -> None:
         """
@@ -173,48 +219,27 @@ class LivePathPlotter:
         Args:
             interval: Update interval in milliseconds
         """
-        if not self.fig:
+        if not self.backend.is_setup:
             self.setup_plot()
         
-        # Force window to front and maximize
-        try:
-            plt.get_current_fig_manager().window.state('zoomed')
-        except:
-            pass
-        
-        self._animation = animation.FuncAnimation(
-            self.fig, 
-            self.update_plot,
-            interval=interval,
-            blit=True,
-            cache_frame_data=False
-        )
-        
+        self.backend.start(self.update_plot, interval)
         self._is_running = True
-        plt.show(block=False)
-        plt.pause(0.1)  # Ensure window renders
     
     def stop_animation(self) -> None:
         """Stop the live animation."""
-        if self._animation:
-            self._animation.event_source.stop()
-            self._is_running = False
+        self.backend.stop()
+        self._is_running = False
     
     def clear(self) -> None:
         """Clear all stored data."""
-        with self._lock:
-            self.raw_lats.clear()
-            self.raw_lons.clear()
-            self.corrected_lats.clear()
-            self.corrected_lons.clear()
-            self.spoofed_indices.clear()
+        # Publishing a new window start empties the display without racing
+        # the producer over the buffers
+        self._start = self._written
+        self.backend.reset()
     
     def close(self) -> None:
         """Close the plot window."""
-        if self.fig:
-            plt.close(self.fig)
-            self.fig = None
-            self.ax = None
+        self.backend.close()
     
     def get_statistics(self) -> Dict[str, int]:
         """
@@ -223,8 +248,8 @@ class LivePathPlotter:
         Returns:
             Dict[str, int]: Statistics including total points and spoofed count
         """
-        with self._lock:
-            return {
-                'total_points': len(self.raw_lats),
-                'spoofed_points': len(self.spoofed_indices)
-            }
\ No newline at end of file
+        spoofed = self._snapshot(self._spoofed)[0]
+        return {
+            'total_points': len(spoofed),
+            'spoofed_points': int(np.count_nonzero(spoofed))
+        }
\ No newline at end of file
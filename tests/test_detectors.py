@@ -1,7 +1,9 @@
 """Tests for spoofing detection algorithms."""
 
 import pytest
-from gps_modulator.detectors import VelocityAnomalyDetector
+import numpy as np
+from gps_modulator.detectors import VelocityAnomalyDetector, DetectResult
+from gps_modulator.types import GpsTrack
 
 
 class TestVelocityAnomalyDetector:
@@ -80,4 +82,65 @@ class TestVelocityAnomalyDetector:
         
         detector.previous_point = previous_point
         result = detector.detect(current_point)
-        assert result is False
\ No newline at end of file
+        assert result is False
+    
+    def test_detect_details(self):
+        """Test that detect_details agrees with detect and reports dt/distance."""
+        points = [
+            {'latitude': 37.7749, 'longitude': -122.4194, 'timestamp': 1000.0},
+            {'latitude': 37.7750, 'longitude': -122.4194, 'timestamp': 1001.0},
+            {'latitude': 37.8749, 'longitude': -122.4194, 'timestamp': 1002.0},
+        ]
+        plain = VelocityAnomalyDetector(threshold_velocity=50.0)
+        detailed = VelocityAnomalyDetector(threshold_velocity=50.0)
+        
+        results = [detailed.detect_details(p) for p in points]
+        
+        assert results[0] == DetectResult(False, 0.0, 0.0, 0.0)
+        assert [bool(r) for r in results] == [plain.detect(p) for p in points]
+        assert results[1].dt == 1.0
+        assert results[1].distance == pytest.approx(11.1, abs=0.1)
+        assert results[2].anomaly and results[2].velocity > 10000
+        assert detailed.previous_point is points[-1]
+    
+    def test_detect_batch_matches_detect(self):
+        """Test that batch detection agrees with point-by-point detection."""
+        rng = np.random.default_rng(11)
+        n = 300
+        points = np.empty((n, 3))
+        points[:, 0] = 37.7749 + np.cumsum(rng.normal(0, 1e-4, n))
+        points[:, 1] = -122.4194 + np.cumsum(rng.normal(0, 1e-4, n))
+        points[:, 2] = 1000.0 + np.arange(n)
+        points[rng.random(n) < 0.1, 0] += 0.01  # injected jumps
+        
+        scalar = VelocityAnomalyDetector(threshold_velocity=50.0)
+        expected = [scalar.detect({'latitude': lat, 'longitude': lon, 'timestamp': ts})
+                    for lat, lon, ts in points]
+        
+        batch = VelocityAnomalyDetector(threshold_velocity=50.0)
+        result = np.concatenate((batch.detect_batch(points[:100]),
+                                 batch.detect_batch(points[100:])))
+        
+        assert result.tolist() == expected
+        assert any(expected)
+        assert batch.previous_point['timestamp'] == points[-1, 2]
+        
+        # Sequences of point dictionaries take the same path
+        dicts = [{'lat': lat, 'lon': lon, 'timestamp': ts} for lat, lon, ts in points]
+        from_dicts = VelocityAnomalyDetector(threshold_velocity=50.0).detect_batch(dicts)
+        assert from_dicts.tolist() == expected
+        
+        # A carried-over previous point may use the aliases too
+        carried = VelocityAnomalyDetector(threshold_velocity=50.0)
+        carried.detect(dicts[0])
+        assert carried.detect_batch(points[1:]).tolist() == expected[1:]
+        
+        track = GpsTrack(points[:, 0].copy(), points[:, 1].copy(), points[:, 2].copy())
+        from_track = VelocityAnomalyDetector(threshold_velocity=50.0).detect_batch(track)
+        assert from_track.tolist() == expected
+        
+        # float32 trigonometry is opt-in and agrees away from the threshold
+        fast = VelocityAnomalyDetector(threshold_velocity=50.0).detect_batch(track, precision='float32')
+        assert fast.tolist() == expected
+        with pytest.raises(ValueError):
+            VelocityAnomalyDetector().detect_batch(track, precision='float16')
@@ -2,9 +2,18 @@
 
 import pytest
 import math
-from gps_modulator.correction.imu_handler import EnhancedIMUHandler, IMUData, MockIMUGenerator
-from gps_modulator.correction.path_corrector import PathCorrector
-from gps_modulator.streaming.imu_streamer import EnhancedGpsReader, IMUStreamer
+import numpy as np
+from gps_modulator.correction.imu_handler import (
+    EnhancedIMUHandler, IMUData, MockIMUGenerator, IMU_DTYPE, stack_imu_data
+)
+from gps_modulator.correction.dead_reckoner import DeadReckoner, PreintegratedImu
+from gps_modulator.correction.path_corrector import (
+    PathCorrector, GPS_POINT_DTYPE, IMU_SAMPLE_DTYPE, correct_sessions
+)
+from gps_modulator.streaming.imu_streamer import (
+    EnhancedGpsReader, IMUStreamer, IMU_RAW_DTYPE, ACCEL_SCALE, GYRO_SCALE, MAG_SCALE,
+    pack_imu_frames, unpack_imu_frames
+)
 
 
 class TestIMUHandler:
@@ -61,6 +70,20 @@ class TestIMUHandler:
         assert 0 <= processed.heading <= 360
         assert processed.timestamp == 1000.0
     
+    def test_stack_imu_data(self):
+        """Test packing processed samples into a structured array."""
+        handler = EnhancedIMUHandler()
+        generator = MockIMUGenerator()
+        samples = [handler.process_imu_data(generator.generate_data(1000.0 + i * 0.1))
+                   for i in range(5)]
+        
+        records = stack_imu_data(samples)
+        
+        assert records.dtype == IMU_DTYPE
+        assert len(records) == 5
+        assert np.allclose(records['heading'], [s.heading for s in samples], atol=1e-4)
+        assert np.array_equal(records['timestamp'], [s.timestamp for s in samples])
+    
     def test_heading_calculation(self):
         """Test heading calculation from magnetometer data."""
         handler = EnhancedIMUHandler()
@@ -196,6 +219,13 @@ class TestPathCorrectorWithIMU:
         assert 'confidence' in corrected
         assert 'correction_method' in corrected
         assert corrected['correction_method'] == 'imu_enhanced'
+        
+        # No time elapsed: the last valid position comes back as a new dict
+        stale = corrector.correct(dict(spoofed_point, timestamp=1000.0),
+                                  is_spoofed=True, imu_data=imu_data)
+        assert type(stale) is dict
+        stale['latitude'] = 0.0
+        assert corrector.last_valid_position['latitude'] == valid_point['latitude']
     
     def test_fallback_correction_without_imu(self):
         """Test fallback correction when IMU data is missing."""
@@ -222,6 +252,208 @@ class TestPathCorrectorWithIMU:
         
         assert corrected['correction_method'] == 'position_hold'
         assert corrected['confidence'] == 0.3
+    
+    def test_specialized_correct_paths(self):
+        """Test correct_valid/correct_spoofed match the correct dispatcher."""
+        dispatched = PathCorrector()
+        specialized = PathCorrector()
+        imu_data = {'heading': 90.0, 'speed': 10.0}
+        
+        first = {'latitude': 40.0, 'longitude': -74.0, 'timestamp': 1000.0}
+        assert specialized.correct_spoofed(first, imu_data) == dispatched.correct(first, True, imu_data)
+        assert specialized.last_valid_position == dispatched.last_valid_position
+        
+        valid = {'latitude': 40.0001, 'longitude': -74.0, 'timestamp': 1001.0}
+        assert specialized.correct_valid(valid) == dispatched.correct(valid)
+        
+        spoofed = {'latitude': 41.0, 'longitude': -75.0, 'timestamp': 1002.0}
+        assert (specialized.correct_spoofed(spoofed, imu_data) ==
+                dispatched.correct(spoofed, is_spoofed=True, imu_data=imu_data))
+        assert specialized.last_valid_position == dispatched.last_valid_position
+    
+    def test_correct_batch_matches_scalar(self):
+        """Test that batch correction agrees with point-by-point correction."""
+        rng = np.random.default_rng(3)
+        n = 50
+        points = np.zeros(n, dtype=GPS_POINT_DTYPE)
+        points['latitude'] = 40.7589 + rng.normal(0, 1e-4, n)
+        points['longitude'] = -73.9851 + rng.normal(0, 1e-4, n)
+        points['timestamp'] = 1000.0 + np.arange(n)
+        is_spoofed = rng.random(n) < 0.3
+        is_spoofed[0] = True  # first point is always accepted
+        imu = np.zeros(n, dtype=IMU_SAMPLE_DTYPE)
+        imu['heading'] = rng.uniform(0, 360, n)
+        imu['speed'] = rng.uniform(0, 10, n)
+        imu['heading'][::4] = np.nan  # some samples without IMU
+        
+        scalar = PathCorrector()
+        expected = []
+        for point, spoofed, sample in zip(points, is_spoofed, imu):
+            imu_data = None
+            if not np.isnan(sample['heading']):
+                imu_data = {'heading': sample['heading'], 'speed': sample['speed']}
+            corrected = scalar.correct(
+                {'latitude': point['latitude'], 'longitude': point['longitude'],
+                 'timestamp': point['timestamp']},
+                bool(spoofed), imu_data
+            )
+            expected.append((corrected['latitude'], corrected['longitude']))
+        
+        # Split in two to exercise carried-over state
+        batch = PathCorrector()
+        first = batch.correct_batch(points[:20], is_spoofed[:20], imu[:20])
+        second = batch.correct_batch(points[20:], is_spoofed[20:], imu[20:])
+        result = np.concatenate((first, second))
+        
+        expected = np.array(expected)
+        np.testing.assert_allclose(result['latitude'], expected[:, 0], rtol=0, atol=1e-9)
+        np.testing.assert_allclose(result['longitude'], expected[:, 1], rtol=0, atol=1e-9)
+        np.testing.assert_array_equal(result['timestamp'], points['timestamp'])
+        assert batch.last_valid_position == scalar.last_valid_position
+    
+    def test_correct_sessions(self):
+        """Test parallel session correction matches sequential correction."""
+        rng = np.random.default_rng(8)
+        sessions = []
+        for n in (30, 1, 45, 0):
+            points = np.zeros(n, dtype=GPS_POINT_DTYPE)
+            points['latitude'] = 48.85 + rng.normal(0, 1e-4, n)
+            points['longitude'] = 2.35 + rng.normal(0, 1e-4, n)
+            points['timestamp'] = np.arange(n, dtype=np.float64)
+            imu = np.zeros(n, dtype=IMU_SAMPLE_DTYPE)
+            imu['heading'] = rng.uniform(0, 360, n)
+            imu['speed'] = rng.uniform(0, 10, n)
+            sessions.append((points, rng.random(n) < 0.4, imu))
+        
+        results = correct_sessions(sessions)
+        
+        assert len(results) == len(sessions)
+        for result, session in zip(results, sessions):
+            np.testing.assert_array_equal(result, PathCorrector().correct_batch(*session))
+
+
+class TestDeadReckoner:
+    """Test cases for dead reckoning updates."""
+    
+    def test_update_batch_matches_scalar(self):
+        """Test that batch updates follow the scalar update path."""
+        rng = np.random.default_rng(5)
+        n = 600
+        headings = rng.uniform(0, 360, n)
+        dts = rng.uniform(0.05, 0.2, n)
+        accels = rng.normal(0, 0.5, n)
+        start = {'latitude': 40.7589, 'longitude': -73.9851}
+        
+        scalar = DeadReckoner(start, initial_velocity=10.0)
+        expected = [scalar.update({'heading': h, 'acceleration': a}, dt)
+                    for h, a, dt in zip(headings, accels, dts)]
+        
+        batch = DeadReckoner(start, initial_velocity=10.0)
+        lats, lons = batch.update_batch(headings, dts, accelerations=accels)
+        
+        np.testing.assert_allclose(lats, [p['latitude'] for p in expected], rtol=0, atol=1e-8)
+        np.testing.assert_allclose(lons, [p['longitude'] for p in expected], rtol=0, atol=1e-8)
+        assert batch.get_current_velocity() == pytest.approx(scalar.get_current_velocity())
+        
+        speeds = rng.uniform(0, 5, 3)
+        lats, _ = batch.update_batch(np.zeros(3), np.ones(3), speeds=speeds)
+        assert lats[-1] - lats[0] > 0  # heading north
+        assert batch.get_current_velocity() == speeds[-1]
+    
+    def test_update_into_out_buffer(self):
+        """Test that update can write into a caller-owned dict."""
+        start = {'latitude': 40.7589, 'longitude': -73.9851}
+        reference = DeadReckoner(start, initial_velocity=5.0)
+        reckoner = DeadReckoner(start, initial_velocity=5.0)
+        out = {}
+        
+        for heading in (0.0, 45.0, 90.0):
+            expected = reference.update({'heading': heading, 'speed': 5.0}, 1.0)
+            result = reckoner.update({'heading': heading, 'speed': 5.0}, 1.0, out=out)
+            assert result is out
+            assert result == expected
+        
+        # The returned buffer is not the reckoner's own state
+        out['latitude'] = 0.0
+        assert reckoner.get_current_position() == expected
+    
+    def test_alias_position_keys(self):
+        """Test that 'lat'/'lon' positions are accepted everywhere."""
+        reckoner = DeadReckoner({'lat': 40.7589, 'lon': -73.9851})
+        assert reckoner.get_current_position() == {'latitude': 40.7589, 'longitude': -73.9851}
+        
+        moved = reckoner.compute_next_position({'lat': 40.7589, 'lon': -73.9851}, 0.0, 100.0)
+        assert moved['latitude'] > 40.7589
+        
+        reckoner.reset({'lat': 1.0, 'longitude': 2.0})
+        assert reckoner.get_current_position() == {'latitude': 1.0, 'longitude': 2.0}
+    
+    def test_nan_propagates(self):
+        """Test that NaN heading or position yields NaN, not a wrapped longitude."""
+        start = {'latitude': 40.7589, 'longitude': -73.9851}
+        
+        position = DeadReckoner(start).update({'heading': float('nan'), 'speed': 10.0}, 1.0)
+        assert math.isnan(position['latitude']) and math.isnan(position['longitude'])
+        
+        position = DeadReckoner(start).compute_next_position(
+            {'latitude': float('nan'), 'longitude': -73.9851}, 90.0, 10.0)
+        assert math.isnan(position['longitude'])
+    
+    def test_velocity_source_selection(self):
+        """Test mixed packets: acceleration wins, otherwise speed is used."""
+        reckoner = DeadReckoner({'latitude': 0.0, 'longitude': 0.0}, initial_velocity=2.0)
+        
+        reckoner.update({'heading': 0.0, 'acceleration': 1.0, 'speed': 50.0}, 1.0)
+        assert reckoner.get_current_velocity() == 3.0
+        
+        reckoner.update({'heading': 0.0, 'speed': 7.0}, 1.0)
+        assert reckoner.get_current_velocity() == 7.0
+        
+        reckoner.update({'heading': 0.0}, 1.0)
+        assert reckoner.get_current_velocity() == 7.0
+    
+    def test_update_matches_great_circle(self):
+        """Test chained steps (small-angle trig, carried latitude) stay exact."""
+        rng = np.random.default_rng(11)
+        reckoner = DeadReckoner({'latitude': 59.9, 'longitude': 179.99})
+        lat, lon = 59.9, 179.99
+        
+        # Short hops use the Taylor path, the last ones plain sin/cos
+        for heading, speed in zip(rng.uniform(0, 360, 200), [20.0] * 195 + [5e4] * 5):
+            position = reckoner.update({'heading': heading, 'speed': speed}, 1.0)
+            lat, lon = DeadReckoner.compute_next_positions(lat, lon, heading, speed)
+            assert position['latitude'] == pytest.approx(lat, abs=1e-9)
+            assert position['longitude'] == pytest.approx(lon, abs=1e-9)
+        
+        # Externally moved position is picked up on the next step
+        reckoner.reset({'latitude': -33.0, 'longitude': 151.0})
+        position = reckoner.update({'heading': 90.0, 'speed': 10.0}, 1.0)
+        expected_lat, _ = DeadReckoner.compute_next_positions(-33.0, 151.0, 90.0, 10.0)
+        assert position['latitude'] == pytest.approx(expected_lat, abs=1e-12)
+    
+    def test_preintegrated_matches_updates(self):
+        """Test applying preintegrated IMU samples once per GPS fix."""
+        rng = np.random.default_rng(3)
+        start = {'latitude': 51.5, 'longitude': -0.12}
+        stepped = DeadReckoner(start, initial_velocity=12.0)
+        preintegrated_reckoner = DeadReckoner(start, initial_velocity=12.0)
+        preintegrated = PreintegratedImu()
+        
+        # Three 1 Hz GPS intervals of 100 Hz IMU samples
+        for _ in range(3):
+            for heading, acceleration in zip(rng.uniform(80, 100, 100), rng.normal(0, 1, 100)):
+                expected = stepped.update({'heading': heading, 'acceleration': acceleration}, 0.01)
+                preintegrated.integrate(heading, 0.01, acceleration)
+            
+            position = preintegrated_reckoner.apply_preintegrated(preintegrated)
+            preintegrated.reset()
+            
+            assert position['latitude'] == pytest.approx(expected['latitude'], abs=1e-9)
+            assert position['longitude'] == pytest.approx(expected['longitude'], abs=1e-9)
+            assert (preintegrated_reckoner.get_current_velocity() ==
+                    pytest.approx(stepped.get_current_velocity()))
+        
+        assert preintegrated.delta_time == 0.0
 
 
 class TestEnhancedGpsReader:
@@ -292,6 +524,50 @@ class TestMockIMUGenerator:
         data = streamer.get_imu_data()
         assert isinstance(data, dict)
         assert 'timestamp' in data
+    
+    def test_imu_streamer_batch(self):
+        """Test block IMU data is one reused array per channel."""
+        streamer = IMUStreamer(update_rate=10.0)
+        
+        batch = streamer.get_imu_batch(16)
+        assert set(batch) == set(streamer.get_imu_data())
+        assert batch['accel_x'].dtype == np.float32
+        assert batch['timestamp'].dtype == np.float64
+        assert all(len(values) == 16 for values in batch.values())
+        assert np.allclose(np.diff(batch['timestamp']), 0.1)
+        assert np.allclose(batch['accel_z'], 9.81, atol=1.0)
+        
+        # Same block size refills the same arrays
+        accel_x = batch['accel_x']
+        assert streamer.get_imu_batch(16)['accel_x'] is accel_x
+        assert len(streamer.get_imu_batch(4)['accel_x']) == 4
+    
+    def test_imu_streamer_batches_do_not_overlap(self):
+        """Test that back-to-back blocks continue the sample clock."""
+        streamer = IMUStreamer(update_rate=10.0)
+        
+        first = streamer.get_imu_batch(16)['timestamp'].copy()
+        second = streamer.get_imu_batch(16)['timestamp']
+        
+        assert second[0] == pytest.approx(first[-1] + 0.1)
+        assert np.allclose(np.diff(np.concatenate((first, second))), 0.1)
+    
+    def test_imu_streamer_raw_frames(self):
+        """Test int16 raw frames round-trip within one quantization step."""
+        streamer = IMUStreamer(update_rate=10.0)
+        
+        assert streamer.get_imu_frames(32).dtype == IMU_RAW_DTYPE
+        
+        batch = streamer.get_imu_batch(32)
+        frames = pack_imu_frames(batch)
+        assert frames.itemsize == 26
+        
+        unpacked = unpack_imu_frames(frames)
+        for prefix, scale in (('accel', ACCEL_SCALE), ('gyro', GYRO_SCALE), ('mag', MAG_SCALE)):
+            for axis in 'xyz':
+                name = f'{prefix}_{axis}'
+                assert np.allclose(unpacked[name], batch[name], rtol=0, atol=scale)
+        assert np.array_equal(unpacked['timestamp'], batch['timestamp'])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,311 @@
+"""Tests for GPS data streaming utilities."""
+
+import collections.abc
+import pytest
+import numpy as np
+from gps_modulator.streaming import (
+    GpsReader, MockGpsGenerator, TimestampBatcher, encode_timestamps, decode_timestamps
+)
+from gps_modulator.types import GPSPoint, GpsTrack
+from gps_modulator.utils import haversine_distance_batch
+
+
+class TestTimestampEncoding:
+    """Test cases for delta + bit-packed timestamp encoding."""
+    
+    def test_roundtrip_irregular_timestamps(self):
+        """Test that jittered timestamps survive encoding at microsecond resolution."""
+        rng = np.random.default_rng(0)
+        timestamps = 1700000000.0 + np.cumsum(0.1 + rng.uniform(-0.005, 0.005, 500))
+        
+        block = encode_timestamps(timestamps)
+        decoded = decode_timestamps(block)
+        
+        assert block.count == 500
+        assert np.max(np.abs(decoded - timestamps)) < 1e-6
+    
+    def test_compression_ratio(self):
+        """Test that 10 Hz timestamps pack well below float64 size."""
+        timestamps = 1700000000.0 + np.arange(1000) * 0.1
+        timestamps[::7] += 0.002  # Sampling jitter
+        
+        block = encode_timestamps(timestamps)
+        
+        assert block.nbytes * 4 < timestamps.nbytes
+        assert np.allclose(block.decode(), timestamps, atol=1e-6, rtol=0)
+    
+    def test_regular_and_edge_cases(self):
+        """Test empty, single and perfectly regular inputs."""
+        assert decode_timestamps(encode_timestamps([])).size == 0
+        assert decode_timestamps(encode_timestamps([1000.5]))[0] == 1000.5
+        
+        block = encode_timestamps([1000.0, 1001.0, 1002.0])
+        assert block.bit_width == 0
+        assert list(block.decode()) == [1000.0, 1001.0, 1002.0]
+
+
+class TestTimestampBatcher:
+    """Test cases for TimestampBatcher."""
+    
+    def test_flush_on_batch_size(self):
+        """Test that a batch is emitted once batch_size records are buffered."""
+        batches = []
+        batcher = TimestampBatcher(batch_size=3, flush_interval=60.0,
+                                   sink=lambda block, records: batches.append((block, records)))
+        
+        for i in range(7):
+            batcher.add({'latitude': 37.0, 'longitude': -122.0, 'timestamp': 1000.0 + i})
+        
+        assert len(batches) == 2
+        assert len(batcher) == 1
+        block, records = batches[0]
+        assert 'timestamp' not in records[0]
+        assert list(block.decode()) == [1000.0, 1001.0, 1002.0]
+        
+        assert list(batches[1][0].decode()) == [1003.0, 1004.0, 1005.0]
+        
+        batcher.flush()
+        assert len(batches) == 3
+        assert list(batches[2][0].decode()) == [1006.0]
+        assert batcher.flush() is None
+    
+    def test_flush_if_due_without_new_records(self):
+        """Test that polling flushes a quiet stream once the interval passes."""
+        import time
+        batcher = TimestampBatcher(batch_size=100, flush_interval=0.05)
+        
+        assert batcher.flush_if_due() is None  # Nothing buffered
+        batcher.add({'latitude': 37.0, 'longitude': -122.0, 'timestamp': 1000.0})
+        assert batcher.flush_if_due() is None  # Not due yet
+        
+        time.sleep(0.06)
+        block, records = batcher.flush_if_due()
+        
+        assert list(block.decode()) == [1000.0]
+        assert len(records) == 1 and len(batcher) == 0
+
+
+class TestMockGpsGeneratorBatch:
+    """Test cases for vectorized mock GPS generation."""
+    
+    def test_generate_batch_walk(self):
+        """Test step size, timestamps and generator state after a batch."""
+        np.random.seed(0)
+        generator = MockGpsGenerator(velocity_mps=5.0, spoof_rate=0.0)
+        start_ts = generator.timestamp
+        
+        batch = generator.generate_batch(500)
+        
+        assert batch.shape == (500,)
+        assert not batch['is_spoofed'].any()
+        steps = haversine_distance_batch(
+            batch['latitude'][:-1], batch['longitude'][:-1],
+            batch['latitude'][1:], batch['longitude'][1:]
+        )
+        np.testing.assert_allclose(steps, 5.0, rtol=1e-3)
+        np.testing.assert_allclose(np.diff(batch['timestamp']), 1.0)
+        assert batch['timestamp'][0] == pytest.approx(start_ts + 1.0)
+        assert generator.point_count == 500
+        assert generator.current_lat == batch['latitude'][-1]
+        assert generator.timestamp == batch['timestamp'][-1]
+    
+    def test_generate_batch_spoof_rate(self):
+        """Test that spoofed points follow the configured rate."""
+        np.random.seed(1)
+        generator = MockGpsGenerator(spoof_rate=0.2)
+        
+        batch = generator.generate_batch(10000)
+        
+        assert 0.18 < batch['is_spoofed'].mean() < 0.22
+        assert generator.generate_batch(0).shape == (0,)
+    
+    def test_generate_batch_interval_scales_step(self):
+        """Test that the step length follows velocity times interval."""
+        np.random.seed(2)
+        generator = MockGpsGenerator(velocity_mps=5.0, spoof_rate=0.0)
+        
+        batch = generator.generate_batch(100, interval=0.1)
+        
+        steps = haversine_distance_batch(
+            batch['latitude'][:-1], batch['longitude'][:-1],
+            batch['latitude'][1:], batch['longitude'][1:]
+        )
+        np.testing.assert_allclose(steps, 0.5, rtol=1e-3)
+        np.testing.assert_allclose(np.diff(batch['timestamp']), 0.1, atol=1e-6)
+    
+    def test_first_streamed_point_takes_nominal_step(self):
+        """Test that time spent before iterating does not move the first point."""
+        generator = MockGpsGenerator(velocity_mps=5.0, spoof_rate=0.0)
+        generator.timestamp -= 60.0  # Constructed a minute before iteration
+        start = (generator.current_lat, generator.current_lon)
+        
+        first = generator._generate_next_point()
+        
+        step = haversine_distance_batch(start[0], start[1],
+                                        np.array([first.latitude]), np.array([first.longitude]))
+        assert step[0] == pytest.approx(0.5, rel=1e-3)
+
+
+class TestGPSPoint:
+    """Test cases for the typed GPS point record."""
+    
+    def test_dict_compatible_access(self):
+        """Test read-only dict-style access and immutability."""
+        point = GPSPoint(37.7749, -122.4194, 1000.0)
+        
+        assert point['latitude'] == point.latitude
+        assert point.get('timestamp') == 1000.0
+        assert point.get('lat', 'missing') == 'missing'
+        assert 'longitude' in point and 'heading' not in point
+        assert dict(point) == point.to_dict() == {
+            'latitude': 37.7749, 'longitude': -122.4194,
+            'timestamp': 1000.0, 'is_spoofed': False
+        }
+        assert GPSPoint.from_mapping({'lat': 37.7749, 'lon': -122.4194, 'ts': 1000}) == point
+        with pytest.raises(KeyError):
+            point['heading']
+        with pytest.raises(AttributeError):
+            point.latitude = 0.0
+        assert isinstance(point, collections.abc.Mapping)
+        assert len(point) == 4 and list(point) == list(point.keys())
+        assert dict(point.items()) == point.to_dict()
+    
+    def test_generator_points_feed_batcher(self):
+        """Test that streamed GPSPoints can be batched like dictionaries."""
+        batcher = TimestampBatcher(batch_size=3, flush_interval=60.0)
+        stream = MockGpsGenerator(spoof_rate=0.0).generate()
+        points = [next(stream) for _ in range(3)]
+        
+        assert batcher.add(points[0]) is None
+        batcher.add(points[1])
+        block, records = batcher.add(points[2])
+        
+        np.testing.assert_allclose(decode_timestamps(block), [p.timestamp for p in points], rtol=0, atol=1e-6)
+        assert records[0] == {'latitude': points[0].latitude,
+                              'longitude': points[0].longitude, 'is_spoofed': False}
+    
+    def test_generator_and_reader_pass_points_through(self):
+        """Test that mock points are GPSPoints and GpsReader keeps them."""
+        generator = MockGpsGenerator(spoof_rate=0.0)
+        points = [generator._generate_next_point() for _ in range(3)]
+        invalid = GPSPoint(91.0, 0.0, 0.0)
+        
+        reader = GpsReader(lambda: iter(points + [invalid]))
+        streamed = list(reader.stream())
+        
+        assert all(type(p) is GPSPoint for p in points)
+        assert streamed == points
+    
+    def test_track_columns(self):
+        """Test building a column track from mixed point mappings."""
+        points = [GPSPoint(37.7749, -122.4194, 1000.0),
+                  {'lat': 37.775, 'lon': -122.419, 'timestamp': 1001}]
+        
+        track = GpsTrack.from_points(points)
+        
+        assert len(track) == 2
+        assert track.latitude.dtype == np.float64
+        assert track[0] == points[0]
+        assert list(track.points()) == [points[0], GPSPoint(37.775, -122.419, 1001.0)]
+        
+        points.append(GPSPoint(91.0, 0.0, 1002.0))
+        assert len(GpsTrack.from_points(points)) == 3
+        assert len(GpsTrack.from_points(points, drop_invalid=True)) == 2
+        
+        # Uniform layouts take the per-layout fast path, mixed ones fall back
+        aliases = [{'lat': 37.775, 'lon': -122.419, 'timestamp': 1001}]
+        canonical = [{'latitude': 37.7749, 'longitude': -122.4194, 'timestamp': 1000.0}]
+        expected = GpsTrack.from_points(points[:2])
+        for layout in (points[:2], canonical + aliases, canonical + [GPSPoint(37.775, -122.419, 1001.0)]):
+            track = GpsTrack.from_points(layout)
+            np.testing.assert_array_equal(track.latitude, expected.latitude)
+            np.testing.assert_array_equal(track.timestamp, expected.timestamp)
+        assert GpsTrack.from_points(aliases).latitude.tolist() == [37.775]
+        assert len(GpsTrack.from_points([])) == 0
+
+
+class TestAsyncSources:
+    """Test cases for asyncio-based real-time sources."""
+    
+    def test_merge_streams_fans_in_sources(self):
+        """Test that merged streams yield points from every source."""
+        import asyncio
+        from gps_modulator.streaming.real_time_sources import MockGpsGenerator, merge_streams
+        
+        async def take(n):
+            sources = [
+                MockGpsGenerator(start_lat=10.0, spoof_rate=0.0, update_interval=0.001),
+                MockGpsGenerator(start_lat=-10.0, spoof_rate=0.0, update_interval=0.001)
+            ]
+            points = []
+            merged = merge_streams(*sources)
+            async for point in merged:
+                points.append(point)
+                if len(points) == n:
+                    break
+            await merged.aclose()
+            return points
+        
+        points = asyncio.run(take(20))
+        
+        assert len(points) == 20
+        assert any(p['latitude'] > 0 for p in points)
+        assert any(p['latitude'] < 0 for p in points)
+    
+    def test_merge_streams_reraises_source_error(self):
+        """Test that a failing source surfaces after the others drain."""
+        import asyncio
+        from gps_modulator.streaming.real_time_sources import merge_streams
+        
+        async def good():
+            for i in range(3):
+                yield {'latitude': float(i), 'longitude': 0.0, 'timestamp': float(i)}
+        
+        async def bad():
+            yield {'latitude': -1.0, 'longitude': 0.0, 'timestamp': 0.0}
+            raise ConnectionError("device unplugged")
+        
+        async def collect(points):
+            async for point in merge_streams(good(), bad()):
+                points.append(point)
+        
+        points = []
+        with pytest.raises(ConnectionError, match="unplugged"):
+            asyncio.run(collect(points))
+        assert len(points) == 4
+    
+    def test_http_session_closed_on_cancel(self, monkeypatch):
+        """Test that cancelling a merged HTTP stream closes its session."""
+        import asyncio
+        from gps_modulator.streaming import real_time_sources as rts
+        
+        class FakeResponse:
+            status = 200
+            async def __aenter__(self):
+                return self
+            async def __aexit__(self, *exc):
+                return False
+            async def json(self):
+                return {'lat': 1.0, 'lon': 2.0, 'timestamp': 3.0}
+        
+        class FakeSession:
+            closed = False
+            def get(self, url):
+                return FakeResponse()
+            async def close(self):
+                FakeSession.closed = True
+        
+        monkeypatch.setattr(rts, 'HTTP_AVAILABLE', True)
+        monkeypatch.setattr(rts, 'AIOHTTP_AVAILABLE', True)
+        source = rts.HttpGPSSource('http://gps.invalid', update_interval=0.001)
+        source._session = FakeSession()
+        
+        async def take_one():
+            merged = rts.merge_streams(source)
+            point = await merged.__anext__()
+            await merged.aclose()
+            return point
+        
+        assert asyncio.run(take_one())['latitude'] == 1.0
+        assert FakeSession.closed
+        assert source._session is None
@@ -2,10 +2,18 @@
 
 import pytest
 import math
+import numpy as np
+from gps_modulator.types import GPSPoint
 from gps_modulator.utils import (
     haversine_distance, 
+    haversine_distance_batch,
+    great_circle_approx,
     compute_velocity, 
+    compute_velocity_batch,
+    velocity_exceeds,
+    velocity_exceeds_batch,
     validate_coordinates,
+    validate_coordinates_batch,
     bearing
 )
 
@@ -26,6 +34,99 @@ class TestHaversineDistance:
         assert abs(distance - expected_distance) < 10000  # Within 10km tolerance
 
 
+class TestHaversineDistanceBatch:
+    """Test cases for vectorized haversine distance calculation."""
+    
+    def test_matches_scalar(self):
+        """Test that batch distances match the scalar implementation."""
+        lats1 = np.array([37.7749, 34.0522, 0.0, -33.8688])
+        lons1 = np.array([-122.4194, -118.2437, 0.0, 151.2093])
+        lats2 = np.array([34.0522, 34.0523, 0.0, 51.5074])
+        lons2 = np.array([-118.2437, -118.2436, 180.0, -0.1278])
+        
+        distances = haversine_distance_batch(lats1, lons1, lats2, lons2)
+        
+        for i in range(len(lats1)):
+            expected = haversine_distance(lats1[i], lons1[i], lats2[i], lons2[i])
+            assert distances[i] == pytest.approx(expected, rel=1e-9)
+    
+    def test_broadcast_and_pairwise(self):
+        """Test broadcasting a single point and the pairwise matrix mode."""
+        lats = np.array([37.7749, 34.0522, 40.7128])
+        lons = np.array([-122.4194, -118.2437, -74.0060])
+        
+        from_sf = haversine_distance_batch(37.7749, -122.4194, lats, lons)
+        assert from_sf.shape == (3,)
+        assert from_sf[0] == pytest.approx(0.0, abs=1e-6)
+        
+        matrix = haversine_distance_batch(lats, lons, lats, lons, comb=True)
+        assert matrix.shape == (3, 3)
+        assert np.allclose(matrix, matrix.T)
+        assert np.allclose(matrix[0], from_sf)
+    
+    def test_fused_kernel_matches_ufuncs(self, monkeypatch):
+        """Test that the large-input fused kernel agrees with the NumPy path."""
+        from gps_modulator.utils import gps_math
+        
+        rng = np.random.default_rng(0)
+        coords = [rng.uniform(-80, 80, (40, 25)), rng.uniform(-180, 180, (40, 25)),
+                  rng.uniform(-80, 80, (40, 25)), rng.uniform(-180, 180, (40, 25))]
+        
+        expected = haversine_distance_batch(*coords)
+        monkeypatch.setattr(gps_math, '_FUSED_MIN_SIZE', 1)
+        fused = haversine_distance_batch(*coords)
+        
+        assert fused.shape == (40, 25)
+        np.testing.assert_allclose(fused, expected, rtol=1e-9, atol=1e-6)
+    
+    def test_float32_precision(self):
+        """Test that float32 distances stay within GPS tolerances."""
+        rng = np.random.default_rng(1)
+        lats = 37.7749 + np.cumsum(rng.normal(0, 1e-4, 1000))
+        lons = -122.4194 + np.cumsum(rng.normal(0, 1e-4, 1000))
+        
+        expected = haversine_distance_batch(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        single = haversine_distance_batch(lats[:-1], lons[:-1], lats[1:], lons[1:],
+                                          precision='float32')
+        
+        assert single.dtype == np.float32
+        np.testing.assert_allclose(single, expected, atol=0.01)
+        assert haversine_distance_batch([37.7749], [-122.4194], [34.0522], [-118.2437],
+                                        precision='float32')[0] == pytest.approx(
+            haversine_distance(37.7749, -122.4194, 34.0522, -118.2437), rel=1e-6)
+        with pytest.raises(ValueError):
+            haversine_distance_batch(lats, lons, lats, lons, precision='float16')
+    
+    def test_nan_propagates(self, monkeypatch):
+        """Test that NaN inputs give NaN distances on every code path."""
+        from gps_modulator.utils import gps_math
+        
+        lats = np.array([np.nan, 37.7749])
+        zeros = np.zeros(2)
+        
+        assert math.isnan(haversine_distance(np.nan, 0.0, 1.0, 1.0))
+        assert np.isnan(haversine_distance_batch(lats, zeros, zeros, zeros)[0])
+        monkeypatch.setattr(gps_math, '_FUSED_MIN_SIZE', 1)
+        fused = haversine_distance_batch(lats, zeros, zeros, zeros)
+        assert np.isnan(fused[0]) and np.isfinite(fused[1])
+
+
+class TestGreatCircleApprox:
+    """Test cases for the equirectangular distance fast path."""
+    
+    def test_short_hop_matches_haversine(self):
+        """Test that short hops agree with haversine to well under a millimeter."""
+        approx = great_circle_approx(37.7749, -122.4194, 37.7750, -122.4195)
+        exact = haversine_distance(37.7749, -122.4194, 37.7750, -122.4195)
+        assert approx == pytest.approx(exact, abs=1e-3)
+    
+    def test_long_distance_falls_back(self):
+        """Test that distant points use the full haversine formula."""
+        approx = great_circle_approx(37.7749, -122.4194, 34.0522, -118.2437)
+        exact = haversine_distance(37.7749, -122.4194, 34.0522, -118.2437)
+        assert approx == exact
+
+
 class TestComputeVelocity:
     """Test cases for velocity computation."""
     
@@ -72,6 +173,100 @@ class TestComputeVelocity:
         
         velocity = compute_velocity(None, current)
         assert velocity == 0.0
+    
+    def test_iso_timestamps(self):
+        """Test velocity with ISO 8601 timestamps."""
+        previous = {
+            'latitude': 37.7749,
+            'longitude': -122.4194,
+            'timestamp': '2024-01-01T00:00:00Z'
+        }
+        current = {
+            'latitude': 37.7758,
+            'longitude': -122.4194,
+            'timestamp': '2024-01-01T00:00:10Z'
+        }
+        
+        velocity = compute_velocity(previous, current)
+        assert velocity == pytest.approx(10.0, rel=0.01)
+    
+    def test_time_interval_parsing(self, monkeypatch):
+        """Test that intervals ignore the host timezone and reject bad mixes."""
+        import time
+        from gps_modulator.utils.gps_math import _parse_time_interval
+        
+        # Naive timestamps across a DST change are wall-clock differences
+        monkeypatch.setenv('TZ', 'America/New_York')
+        time.tzset()
+        try:
+            assert _parse_time_interval('2024-03-10T01:30:00', '2024-03-10T03:30:00') == 7200.0
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        
+        assert _parse_time_interval('2024-01-01T00:00:00', '2024-01-01T00:00:10Z') == 0.0
+        interval = _parse_time_interval(1000, 1010)
+        assert interval == 10.0 and type(interval) is float
+    
+    def test_mixed_key_styles(self):
+        """Test that 'lat'/'lon' aliases and canonical keys can be mixed."""
+        previous = {'lat': 37.7749, 'lon': -122.4194, 'timestamp': 1000.0}
+        current = {'latitude': 37.7758, 'longitude': -122.4194, 'timestamp': 1010.0}
+        
+        assert compute_velocity(previous, current) == pytest.approx(10.0, rel=0.01)
+        assert compute_velocity(current, GPSPoint(37.7767, -122.4194, 1020.0)) == pytest.approx(10.0, rel=0.01)
+        assert velocity_exceeds(previous, current, 5.0)
+        assert not velocity_exceeds(previous, current, 15.0)
+
+
+class TestComputeVelocityBatch:
+    """Test cases for batch velocity computation."""
+    
+    def _track(self):
+        rng = np.random.default_rng(7)
+        lats = 37.7749 + np.cumsum(rng.normal(0, 1e-4, 200))
+        lons = -122.4194 + np.cumsum(rng.normal(0, 1e-4, 200))
+        lats[100] += 1.0  # one long jump to exercise the haversine fallback
+        ts = 1000.0 + np.arange(200.0)
+        ts[50] = ts[49]  # zero time interval
+        return lats, lons, ts
+    
+    def test_matches_compute_velocity(self):
+        """Test that batch velocities agree with compute_velocity."""
+        lats, lons, ts = self._track()
+        expected = [
+            compute_velocity({'latitude': lats[i - 1], 'longitude': lons[i - 1], 'timestamp': ts[i - 1]},
+                             {'latitude': lats[i], 'longitude': lons[i], 'timestamp': ts[i]})
+            for i in range(1, len(lats))
+        ]
+        
+        batch = compute_velocity_batch(lats, lons, ts)
+        
+        np.testing.assert_allclose(batch, expected, rtol=1e-6)
+        assert batch[49] == 0.0
+        
+        single = compute_velocity_batch(lats, lons, ts, precision='float32')
+        assert single.dtype == np.float32
+        np.testing.assert_allclose(single, batch, atol=1e-3)
+    
+    def test_velocity_exceeds_matches_compute_velocity(self):
+        """Test the squared-distance threshold check against compute_velocity."""
+        lats, lons, ts = self._track()
+        for i in range(1, len(lats)):
+            prev = {'latitude': lats[i - 1], 'longitude': lons[i - 1], 'timestamp': ts[i - 1]}
+            curr = {'latitude': lats[i], 'longitude': lons[i], 'timestamp': ts[i]}
+            velocity = compute_velocity(prev, curr)
+            for threshold in (velocity * 0.99, velocity * 1.01):
+                assert velocity_exceeds(prev, curr, threshold) == (velocity > threshold)
+    
+    def test_velocity_exceeds_batch_matches_compute_velocity_batch(self):
+        """Test the batch threshold check, including the zero interval and long jump."""
+        lats, lons, ts = self._track()
+        velocities = compute_velocity_batch(lats, lons, ts)
+        for threshold in (0.0, 5.0, 12.0, 30.0):
+            for precision in ('float64', 'float32'):
+                exceeds = velocity_exceeds_batch(lats, lons, ts, threshold, precision=precision)
+                np.testing.assert_array_equal(exceeds, velocities > threshold)
 
 
 class TestValidateCoordinates:
@@ -92,6 +287,16 @@ class TestValidateCoordinates:
         """Test invalid longitude values."""
         assert validate_coordinates(0, 181) is False  # Too high
         assert validate_coordinates(0, -181) is False  # Too low
+    
+    def test_batch_matches_scalar(self):
+        """Test vectorized validation, including NaN inputs."""
+        lats = np.array([0.0, 90.0, -90.0, 90.1, 45.0, np.nan])
+        lons = np.array([0.0, 180.0, -180.0, 0.0, -180.5, 0.0])
+        
+        mask = validate_coordinates_batch(lats, lons)
+        
+        assert mask.tolist() == [True, True, True, False, False, False]
+        assert mask[:5].tolist() == [validate_coordinates(a, b) for a, b in zip(lats[:5], lons[:5])]
 
 
 class TestBearing:
@@ -105,4 +310,8 @@ class TestBearing:
     def test_east_bearing(self):
         """Test bearing calculation for east direction."""
         bearing_deg = bearing(37.7749, -122.4194, 37.7749, -122.4094)
-        assert abs(bearing_deg - 90) < 5  # Should be close to 90 degrees
\ No newline at end of file
+        assert abs(bearing_deg - 90) < 5  # Should be close to 90 degrees
+    
+    def test_nan_propagates(self):
+        """Test that a NaN coordinate is not turned into a valid bearing."""
+        assert math.isnan(bearing(float('nan'), 0.0, 1.0, 1.0))
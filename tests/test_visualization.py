@@ -0,0 +1,108 @@
+"""Tests for visualization components."""
+
+import pytest
+import numpy as np
+from gps_modulator.visualization import LivePathPlotter
+
+
+class TestLivePathPlotter:
+    """Test cases for the live path plotter."""
+    
+    def test_ring_buffer_keeps_newest_points(self):
+        """Test that the oldest points are dropped once the buffer is full."""
+        plotter = LivePathPlotter(max_points=10, interactive=False)
+        for i in range(25):
+            plotter.add_point({'latitude': float(i), 'longitude': 0.0}, is_spoofed=i % 5 == 0)
+        
+        assert plotter.raw_lats.tolist() == [float(i) for i in range(15, 25)]
+        assert plotter.spoofed_indices == [0, 5]
+        assert plotter.get_statistics() == {'total_points': 10, 'spoofed_points': 2}
+        
+        plotter.clear()
+        assert plotter.get_statistics()['total_points'] == 0
+    
+    @pytest.mark.parametrize('max_points', [50, 2])
+    def test_snapshots_consistent_with_producer_thread(self, max_points):
+        """Test that reads never see a half-overwritten ring buffer."""
+        import sys
+        import threading
+        # A tiny window makes the producer lap snapshots being copied
+        plotter = LivePathPlotter(max_points=max_points, interactive=False)
+        stop = threading.Event()
+        
+        def produce():
+            i = 0
+            while not stop.is_set():
+                plotter.add_point({'latitude': float(i), 'longitude': 0.0})
+                i += 1
+        
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        producer = threading.Thread(target=produce)
+        producer.start()
+        try:
+            for _ in range(2000):
+                lats, _ = plotter._snapshot(plotter._raw_lat, plotter._spoofed)
+                assert np.all(np.diff(lats) == 1.0)  # Oldest to newest, no gaps
+                assert len(lats) <= max_points
+        finally:
+            stop.set()
+            producer.join()
+            sys.setswitchinterval(interval)
+    
+    def test_render_frame_headless(self):
+        """Test off-screen rendering of the path to an RGB array."""
+        plotter = LivePathPlotter(max_points=100, interactive=False)
+        for i in range(50):
+            plotter.add_point({'latitude': 37.0 + i * 1e-4, 'longitude': -122.0 + i * 1e-4},
+                              is_spoofed=i == 25)
+        
+        frame = plotter.render_frame()
+        empty = LivePathPlotter(interactive=False).render_frame()
+        plotter.close()
+        
+        assert frame.dtype == np.uint8
+        assert frame.ndim == 3 and frame.shape[2] == 3
+        assert frame.shape == empty.shape
+        assert not np.array_equal(frame, empty)  # path pixels were drawn
+    
+    def test_render_frame_unsupported_backend(self):
+        """Test that render_frame rejects backends without off-screen rendering."""
+        from gps_modulator.visualization.backends import PlotBackend
+        
+        class WindowOnlyBackend(PlotBackend):
+            def setup(self): self.opened = True
+            def draw(self, *arrays): return ()
+            def start(self, update, interval): pass
+            def stop(self): pass
+            def close(self): pass
+            is_setup = property(lambda self: hasattr(self, 'opened'))
+        
+        backend = WindowOnlyBackend('test')
+        plotter = LivePathPlotter(backend=backend)
+        with pytest.raises(ValueError, match='WindowOnlyBackend'):
+            plotter.render_frame()
+        assert not backend.is_setup  # no window was opened
+    
+    def test_plain_draw_without_animation(self):
+        """Test that path artists show up in a normal draw when no animation runs."""
+        def coloured_pixels(plotter):
+            plotter.fig.canvas.draw()
+            rgb = np.asarray(plotter.fig.canvas.buffer_rgba())[..., :3].astype(int)
+            # Count pixels that are clearly not grey (axes, text and grid are grey)
+            return int(np.count_nonzero(rgb.max(axis=-1) - rgb.min(axis=-1) > 60))
+        
+        empty = LivePathPlotter(interactive=False)
+        empty.setup_plot()
+        baseline = coloured_pixels(empty)
+        
+        plotter = LivePathPlotter(max_points=100, interactive=False)
+        plotter.setup_plot()
+        for i in range(50):
+            plotter.add_point({'latitude': 37.0 + i * 1e-4, 'longitude': -122.0 + i * 1e-4},
+                              is_spoofed=i == 25)
+        plotter.update_plot(None)
+        
+        assert coloured_pixels(plotter) > baseline + 1000
+        plotter.close()
+        empty.close()